@@ -155,3 +155,17 @@ pub enum IdentifierType {
     GeneSymbol,
     Unknown,
 }
+
+/// Classifies an identifier by its RefSeq accession prefix.
+///
+/// `NC_`/`NW_`/`NT_` are genomic, `NM_`/`NR_`/`XM_`/`XR_` are transcripts and
+/// `NP_`/`XP_` are proteins. Anything else is `Unknown`; deciding whether it is a
+/// gene symbol is left to the data provider.
+pub fn classify_identifier(identifier: &str) -> IdentifierType {
+    match identifier.as_bytes() {
+        [b'N', b'C' | b'W' | b'T', b'_', ..] => IdentifierType::GenomicAccession,
+        [b'N' | b'X', b'M' | b'R', b'_', ..] => IdentifierType::TranscriptAccession,
+        [b'N' | b'X', b'P', b'_', ..] => IdentifierType::ProteinAccession,
+        _ => IdentifierType::Unknown,
+    }
+}
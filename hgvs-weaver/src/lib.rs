@@ -5,8 +5,33 @@ use pest_derive::Parser as PestParser;
 #[grammar = "grammar.pest"]
 pub struct HgvsParser;
 
+/// Cheap structural check run before the full grammar.
+///
+/// Every `hgvs_variant` starts with an accession (leading ASCII letter), and the
+/// first `:` is followed by a coordinate type letter and `.`. Inputs failing this
+/// scan can be rejected without entering the pest parser.
+fn has_variant_prefix(hgvs_str: &str) -> bool {
+    let s = hgvs_str.trim_start_matches([' ', '\t']);
+    if !s.as_bytes().first().is_some_and(u8::is_ascii_alphabetic) {
+        return false;
+    }
+    let Some(colon) = s.find(':') else {
+        return false;
+    };
+    let mut rest = s[colon + 1..].bytes().filter(|b| *b != b' ' && *b != b'\t');
+    matches!(rest.next(), Some(b'c' | b'g' | b'm' | b'n' | b'r' | b'p'))
+        && rest.next() == Some(b'.')
+}
+
 /// Parses an HGVS string into a `SequenceVariant`.
 pub fn parse_hgvs_variant(hgvs_str: &str) -> Result<SequenceVariant, HgvsError> {
+    if !has_variant_prefix(hgvs_str) {
+        return Err(HgvsError::PestError(format!(
+            "Invalid HGVS variant '{}': expected '<accession>:<type>.' prefix",
+            hgvs_str
+        )));
+    }
+
     let mut pairs = HgvsParser::parse(Rule::hgvs_variant, hgvs_str)
         .map_err(|e| HgvsError::PestError(e.to_string()))?;
 
@@ -162,7 +187,7 @@ pub mod utils;
 
 // Re-exports for public usage
 pub use coords::SequenceVariant;
-pub use data::{DataProvider, IdentifierKind, Transcript, TranscriptSearch};
+pub use data::{classify_identifier, DataProvider, IdentifierKind, Transcript, TranscriptSearch};
 pub use equivalence::VariantEquivalence;
 pub use error::HgvsError;
 pub use mapper::VariantMapper;
@@ -5,6 +5,7 @@ use crate::error::HgvsError;
 use crate::sequence::{LazySequence, MemSequence, RevCompSequence, Sequence, TranslatedSequence};
 use crate::structs::{BaseOffsetInterval, CVariant, GVariant, PVariant};
 use crate::transcript_mapper::TranscriptMapper;
+use std::collections::VecDeque;
 
 /// High-level mapper for transforming variants between coordinate systems.
 pub struct VariantMapper<'a> {
@@ -679,16 +680,22 @@ impl<'a> VariantMapper<'a> {
                 && (end - start) != alt_str.len())
         {
             // Deletion, Duplication, or DelIns with a non-empty range
-            let mut current_ref = if ref_str.is_empty() {
-                self.hdp.get_seq(
-                    ac,
-                    curr_start as i32,
-                    curr_end as i32,
-                    kind.into_identifier_type(),
-                )?
+            let mut current_ref: VecDeque<u8> = if ref_str.is_empty() {
+                self.hdp
+                    .get_seq(
+                        ac,
+                        curr_start as i32,
+                        curr_end as i32,
+                        kind.into_identifier_type(),
+                    )?
+                    .into_bytes()
+                    .into()
             } else {
-                ref_str.to_string()
+                ref_str.bytes().collect()
             };
+            // Once current_ref holds the reference at [curr_start, curr_end) it can be slid
+            // along with the range, so a long repeat costs no extra provider calls per base.
+            let mut ref_is_fetched = ref_str.is_empty();
 
             if current_ref.is_empty() {
                 return Ok((curr_start, curr_end));
@@ -716,19 +723,29 @@ impl<'a> VariantMapper<'a> {
                 // To shift a delins/del/dup, the next base must match the first base of the range being shifted.
                 // And the range must be "internally" repetitive or we must match the whole range?
                 // Standard 3' shift: if seq[start] == seq[end], then [start, end) -> [start+1, end+1) is equivalent.
-                let first_ref_byte = current_ref.as_bytes()[0];
-                if first_ref_byte == chunk_bytes[curr_end - chunk_start] {
+                let next_byte = chunk_bytes[curr_end - chunk_start];
+                if current_ref[0] == next_byte {
                     curr_start += 1;
                     curr_end += 1;
                     // Update current_ref for the next iteration (it's the sequence at the new [start, end))
-                    current_ref = self.hdp.get_seq(
-                        ac,
-                        curr_start as i32,
-                        curr_end as i32,
-                        kind.into_identifier_type(),
-                    )?;
-                    if current_ref.is_empty() {
-                        break;
+                    if ref_is_fetched {
+                        current_ref.pop_front();
+                        current_ref.push_back(next_byte);
+                    } else {
+                        current_ref = self
+                            .hdp
+                            .get_seq(
+                                ac,
+                                curr_start as i32,
+                                curr_end as i32,
+                                kind.into_identifier_type(),
+                            )?
+                            .into_bytes()
+                            .into();
+                        ref_is_fetched = true;
+                        if current_ref.is_empty() {
+                            break;
+                        }
                     }
                 } else {
                     break;
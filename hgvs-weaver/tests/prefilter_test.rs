@@ -0,0 +1,61 @@
+use hgvs_weaver::data::IdentifierType;
+use hgvs_weaver::*;
+
+#[test]
+fn test_prefilter_rejects_malformed() {
+    let invalid = vec![
+        "22G>A",
+        "77dup",
+        "G.44del",
+        "G>A",
+        "NM_001301.4::c.122-6T>A",
+        "NM_001301.4:x.122-6T>A",
+        "NM_001301.4:c122-6T>A",
+        "",
+    ];
+    for v in invalid {
+        let err = parse_hgvs_variant(v).expect_err(v);
+        assert!(err.to_string().contains("variant"), "{}: {}", v, err);
+    }
+}
+
+#[test]
+fn test_prefilter_allows_valid() {
+    let valid = vec![
+        "NC_000001.11:g.1234del",
+        "NG_012232.1(NM_004006.2):c.93+1G>T",
+        "NM_004006.3:r.123c>g",
+        "NP_003997.1:p.Trp24Cys",
+        "NC_012920.1:m.3243A>G",
+        "NR_028379.1:n.345A>G",
+    ];
+    for v in valid {
+        assert!(parse_hgvs_variant(v).is_ok(), "Failed to parse {}", v);
+    }
+}
+
+#[test]
+fn test_classify_identifier() {
+    assert_eq!(
+        classify_identifier("NC_000001.11"),
+        IdentifierType::GenomicAccession
+    );
+    assert_eq!(
+        classify_identifier("NW_1.1"),
+        IdentifierType::GenomicAccession
+    );
+    assert_eq!(
+        classify_identifier("NM_000051.3"),
+        IdentifierType::TranscriptAccession
+    );
+    assert_eq!(
+        classify_identifier("XR_001.1"),
+        IdentifierType::TranscriptAccession
+    );
+    assert_eq!(
+        classify_identifier("NP_000042.3"),
+        IdentifierType::ProteinAccession
+    );
+    assert_eq!(classify_identifier("BRAF"), IdentifierType::Unknown);
+    assert_eq!(classify_identifier("NM"), IdentifierType::Unknown);
+}
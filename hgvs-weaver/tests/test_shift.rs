@@ -96,3 +96,68 @@ fn test_ins_3_prime_shifting() -> Result<(), HgvsError> {
 }
 
 use hgvs_weaver::SequenceVariant;
+
+/// Wraps HomopolymerProvider and counts get_seq calls.
+struct CountingProvider {
+    calls: std::cell::Cell<usize>,
+}
+impl DataProvider for CountingProvider {
+    fn get_transcript(
+        &self,
+        ac: &str,
+        ref_ac: Option<&str>,
+    ) -> Result<Box<dyn Transcript>, HgvsError> {
+        HomopolymerProvider.get_transcript(ac, ref_ac)
+    }
+    fn get_seq(
+        &self,
+        ac: &str,
+        start: i32,
+        end: i32,
+        kind: IdentifierType,
+    ) -> Result<String, HgvsError> {
+        self.calls.set(self.calls.get() + 1);
+        HomopolymerProvider.get_seq(ac, start, end, kind)
+    }
+    fn get_symbol_accessions(
+        &self,
+        s: &str,
+        f: IdentifierKind,
+        t: IdentifierKind,
+    ) -> Result<Vec<(IdentifierType, String)>, HgvsError> {
+        HomopolymerProvider.get_symbol_accessions(s, f, t)
+    }
+    fn get_identifier_type(&self, id: &str) -> Result<IdentifierType, HgvsError> {
+        HomopolymerProvider.get_identifier_type(id)
+    }
+    fn c_to_g(
+        &self,
+        transcript_ac: &str,
+        pos: TranscriptPos,
+        offset: IntronicOffset,
+    ) -> Result<(String, GenomicPos), HgvsError> {
+        HomopolymerProvider.c_to_g(transcript_ac, pos, offset)
+    }
+}
+
+#[test]
+fn test_del_3_prime_shifting_long_run() -> Result<(), HgvsError> {
+    let hdp = CountingProvider {
+        calls: std::cell::Cell::new(0),
+    };
+    let mapper = VariantMapper::new(&hdp);
+
+    let v1 = hgvs_weaver::parse_hgvs_variant("NC_TEST.1:g.5del")?;
+    let nv1 = mapper.normalize_variant(v1)?;
+    let v2 = hgvs_weaver::parse_hgvs_variant("NC_TEST.1:g.1500del")?;
+    let nv2 = mapper.normalize_variant(v2)?;
+
+    assert_eq!(nv1.to_string(), nv2.to_string());
+    // Shifting across the ~2kb run reads the reference in chunks, not once per base.
+    assert!(
+        hdp.calls.get() < 100,
+        "get_seq called {} times",
+        hdp.calls.get()
+    );
+    Ok(())
+}
@@ -49,6 +49,8 @@ def get_relevant_commits(
 
 REPO_ROOT = Path(__file__).parent.parent.resolve()
 WORKTREE_DIR = REPO_ROOT.parent / "hgvs-rs-bench-tmp"
+# Cargo target dir shared by every per-commit worktree, so each build is incremental rather than cold.
+CARGO_TARGET_DIR = WORKTREE_DIR / "target"
 INPUT_FILE = REPO_ROOT / "clinvar_baseline_validation.tsv"
 RESULTS_DIR = REPO_ROOT / "benchmark_results"
 RESULTS_DIR.mkdir(exist_ok=True)
@@ -85,14 +87,35 @@ def run(
     return res
 
 
-def setup_worktree() -> None:
-    if WORKTREE_DIR.exists():
-        print(f"Cleaning up existing worktree at {WORKTREE_DIR}...")
-        run(["git", "worktree", "remove", "-f", str(WORKTREE_DIR)])
-        shutil.rmtree(WORKTREE_DIR, ignore_errors=True)
+def setup_worktree(commit: str) -> Path:
+    """Materializes `commit` directly from the object store into its own worktree."""
+    target_dir = WORKTREE_DIR / commit
+    if target_dir.exists():
+        print(f"Cleaning up existing worktree at {target_dir}...")
+        run(["git", "worktree", "remove", "-f", str(target_dir)], check=False)
+        shutil.rmtree(target_dir, ignore_errors=True)
+
+    print(f"Creating worktree for {commit} at {target_dir}...")
+    WORKTREE_DIR.mkdir(parents=True, exist_ok=True)
+    run(["git", "worktree", "add", "--detach", str(target_dir), commit])
+    return target_dir
+
 
-    print(f"Creating worktree at {WORKTREE_DIR}...")
-    run(["git", "worktree", "add", "--detach", str(WORKTREE_DIR), "HEAD"])
+def teardown_worktree(target_dir: Path) -> None:
+    if target_dir.exists():
+        print(f"Removing worktree at {target_dir}...")
+        run(["git", "worktree", "remove", "-f", str(target_dir)], check=False)
+        shutil.rmtree(target_dir, ignore_errors=True)
+
+
+def cleanup_worktrees() -> None:
+    """Removes all benchmark worktrees but keeps the shared cargo target dir for the next run."""
+    if WORKTREE_DIR.exists():
+        print("Cleaning up worktrees...")
+        for entry in WORKTREE_DIR.iterdir():
+            if entry != CARGO_TARGET_DIR:
+                shutil.rmtree(entry, ignore_errors=True)
+        run(["git", "worktree", "prune"], check=False)
 
 
 def link_data(target_dir: Path) -> None:
@@ -122,6 +145,7 @@ def build_weaver(target_dir: Path) -> None:
     env = os.environ.copy()
     env["VIRTUAL_ENV"] = str(REPO_ROOT / ".venv")
     env["PATH"] = f"{venv_bin}:{env.get('PATH', '')}"
+    env["CARGO_TARGET_DIR"] = str(CARGO_TARGET_DIR)
 
     run([maturin_exe, "develop"], cwd=target_dir, env=env)
 
@@ -238,9 +262,6 @@ def main() -> None:  # noqa: PLR0915
                 print("Warning: history.json is corrupted, starting fresh.")
 
     try:
-        setup_worktree()
-        link_data(WORKTREE_DIR)
-
         for i, commit_info in enumerate(commits):
             commit = commit_info["hash"]
             print(f"\n=== Benchmark {i + 1}/{len(commits)}: {commit} ({commit_info['date']}) ===")
@@ -250,15 +271,20 @@ def main() -> None:  # noqa: PLR0915
                 print(f"Skipping {commit}, already benchmarked.")
                 continue
 
-            run(["git", "checkout", commit], cwd=WORKTREE_DIR)
-
+            commit_dir = setup_worktree(commit)
             try:
-                build_weaver(WORKTREE_DIR)
-            except subprocess.CalledProcessError:
-                print(f"Skipping {commit} due to build failure.")
-                continue
+                link_data(commit_dir)
+
+                try:
+                    build_weaver(commit_dir)
+                except subprocess.CalledProcessError:
+                    print(f"Skipping {commit} due to build failure.")
+                    continue
+
+                res_file = validate(commit_dir, commit, max_variants=args.max_variants)
+            finally:
+                teardown_worktree(commit_dir)
 
-            res_file = validate(WORKTREE_DIR, commit, max_variants=args.max_variants)
             stats = analyze(res_file)
             if stats:
                 stats["commit"] = commit
@@ -274,10 +300,7 @@ def main() -> None:  # noqa: PLR0915
                 json.dump(sorted_history, f, indent=2)
 
     finally:
-        if WORKTREE_DIR.exists():
-            print("Cleaning up worktree...")
-            run(["git", "worktree", "remove", "-f", str(WORKTREE_DIR)])
-            shutil.rmtree(WORKTREE_DIR, ignore_errors=True)
+        cleanup_worktrees()
 
 
 if __name__ == "__main__":
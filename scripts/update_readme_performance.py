@@ -1,27 +1,54 @@
 #!/usr/bin/env python3
 # /// script
-# dependencies = [
-#   "seaborn",
-#   "matplotlib",
-#   "pandas",
-# ]
+# dependencies = []
 # ///
 
-import io
+import html
 import json
 import re
 import subprocess
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
-
 REPO_ROOT = Path(__file__).parent.parent.resolve()
 HISTORY_FILE = REPO_ROOT / "benchmark_results" / "history.json"
 README_FILE = REPO_ROOT / "README.md"
 PYPROJECT_FILE = REPO_ROOT / "pyproject.toml"
 
+# Chart geometry (SVG user units).
+PLOT_WIDTH = 800
+PLOT_HEIGHT = 320
+MARGIN_LEFT = 70
+MARGIN_TOP = 60
+MARGIN_BOTTOM = 70
+LEGEND_WIDTH = 200
+Y_MIN = 85.0  # Zoom in on the high performance range
+Y_MAX = 100.0
+Y_TICK_STEP = 2.5
+TOOLS = ["Weaver", "Ref-HGVS"]
+
+# Blue for Weaver, Green for Ref
+PALETTES = {
+    "light": {
+        "text": "#262626",
+        "grid": "#cccccc",
+        "edge": "#ffffff",
+        "Weaver-Identity": "#3498db",
+        "Weaver-Analogous": "#85c1e9",
+        "Ref-HGVS-Identity": "#27ae60",
+        "Ref-HGVS-Analogous": "#7dcea0",
+    },
+    # GitHub dark mode colors: bg=#0d1117, grid=#30363d
+    "dark": {
+        "text": "#e6edf3",
+        "grid": "#30363d",
+        "edge": "#0d1117",
+        "Weaver-Identity": "#2980b9",
+        "Weaver-Analogous": "#5dade2",
+        "Ref-HGVS-Identity": "#27ae60",
+        "Ref-HGVS-Analogous": "#52be80",
+    },
+}
+
 
 def run(cmd: list[str]) -> str:
     return subprocess.check_output(cmd, text=True, cwd=REPO_ROOT, shell=False).strip()  # noqa: S603
@@ -49,108 +76,101 @@ def get_current_version() -> str:
     return match.group(1) if match else "unknown"
 
 
-def generate_svg(data_points: list[dict], mode: str = "light") -> str:
-    # Prepare data for plotting
-    results_df = pd.DataFrame(data_points)
-
-    # Set style based on mode
-    if mode == "dark":
-        # GitHub dark mode colors: bg=#0d1117, grid=#30363d
-        sns.set_theme(
-            style="darkgrid",
-            context="talk",
-            rc={
-                "axes.facecolor": "#0d1117",
-                "figure.facecolor": "#0d1117",
-                "text.color": "#e6edf3",
-                "axes.labelcolor": "#e6edf3",
-                "xtick.color": "#e6edf3",
-                "ytick.color": "#e6edf3",
-                "grid.color": "#30363d",
-                "patch.edgecolor": "#30363d",
-            },
-        )
-    else:
-        sns.set_theme(style="whitegrid", context="talk")
-
-    _fig, ax = plt.subplots(figsize=(12, 6))
+def _y(value: float) -> float:
+    """Maps a percentage onto the plot's vertical axis, clamped to the visible range."""
+    clamped = min(max(value, Y_MIN), Y_MAX)
+    return MARGIN_TOP + (Y_MAX - clamped) / (Y_MAX - Y_MIN) * PLOT_HEIGHT
 
-    # Standardize data: Identity and Analogous as percentages
-    results_df["Identity %"] = (results_df["identity"] / results_df["total"]) * 100
-    results_df["Analogous %"] = (results_df["analogous"] / results_df["total"]) * 100
 
-    versions = results_df["version"].unique()
-    tools = ["Weaver", "Ref-HGVS"]
+def _percent(count: int, total: int) -> float:
+    return count / total * 100 if total else 0.0
 
-    x = range(len(versions))
-    width = 0.35  # width of bars
 
-    # Colors
-    # Blue for Weaver, Green for Ref
-    if mode == "dark":
-        colors = {
-            ("Weaver", "Identity"): "#2980b9",
-            ("Weaver", "Analogous"): "#5dade2",
-            ("Ref-HGVS", "Identity"): "#27ae60",
-            ("Ref-HGVS", "Analogous"): "#52be80",
-        }
-    else:
-        colors = {
-            ("Weaver", "Identity"): "#3498db",
-            ("Weaver", "Analogous"): "#85c1e9",
-            ("Ref-HGVS", "Identity"): "#27ae60",
-            ("Ref-HGVS", "Analogous"): "#7dcea0",
-        }
-
-    for i, tool in enumerate(tools):
-        tool_df = results_df[results_df["tool"] == tool]
-
-        # Calculate offsets for grouped bars
-        offset = (i - 0.5) * width
-
-        # Identity bar
-        _rects1 = ax.bar(
-            [pos + offset for pos in x],
-            tool_df["Identity %"],
-            width,
-            label=f"{tool} Identity",
-            color=colors[(tool, "Identity")],
-            edgecolor="#ffffff" if mode == "light" else "#0d1117",
+def generate_svg(data_points: list[dict], mode: str = "light") -> str:
+    palette = PALETTES[mode]
+    versions = list(dict.fromkeys(d["version"] for d in data_points))
+
+    # Group (version, identity %, analogous %) per tool in one pass.
+    by_tool: dict[str, list[tuple[str, float, float]]] = {tool: [] for tool in TOOLS}
+    for d in data_points:
+        by_tool[d["tool"]].append(
+            (d["version"], _percent(d["identity"], d["total"]), _percent(d["analogous"], d["total"])),
         )
 
-        # Analogous bar (stacked)
-        bottom = tool_df["Identity %"].values
-        _rects2 = ax.bar(
-            [pos + offset for pos in x],
-            tool_df["Analogous %"],
-            width,
-            bottom=bottom,
-            label=f"{tool} Analogous",
-            color=colors[(tool, "Analogous")],
-            edgecolor="#ffffff" if mode == "light" else "#0d1117",
+    x_scale = PLOT_WIDTH / len(versions)
+    bar_w = x_scale * 0.35
+    width = MARGIN_LEFT + PLOT_WIDTH + LEGEND_WIDTH
+    height = MARGIN_TOP + PLOT_HEIGHT + MARGIN_BOTTOM
+    plot_left = MARGIN_LEFT
+    plot_right = MARGIN_LEFT + PLOT_WIDTH
+    plot_bottom = MARGIN_TOP + PLOT_HEIGHT
+
+    parts = [
+        (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}" font-family="DejaVu Sans, Arial, sans-serif">'
+        ),
+        "<style>",
+        f"text {{ fill: {palette['text']}; }}",
+        f".grid {{ stroke: {palette['grid']}; stroke-width: 1; }}",
+        f"rect.bar {{ stroke: {palette['edge']}; stroke-width: 1; }}",
+        *(f".{key} {{ fill: {color}; }}" for key, color in palette.items() if key.endswith(("Identity", "Analogous"))),
+        "</style>",
+        (
+            f'<text x="{plot_left + PLOT_WIDTH / 2}" y="{MARGIN_TOP / 2}" font-size="18" text-anchor="middle">'
+            "Protein Projection Performance (100k ClinVar Variants)</text>"
+        ),
+    ]
+
+    # Horizontal grid lines and y tick labels.
+    n_ticks = round((Y_MAX - Y_MIN) / Y_TICK_STEP)
+    for k in range(n_ticks + 1):
+        tick = Y_MIN + k * Y_TICK_STEP
+        y = _y(tick)
+        parts.append(f'<line class="grid" x1="{plot_left}" y1="{y:.1f}" x2="{plot_right}" y2="{y:.1f}"/>')
+        parts.append(
+            f'<text x="{plot_left - 8}" y="{y + 4:.1f}" font-size="12" text-anchor="end">{tick:g}</text>',
         )
 
-    # Customize labels and title
-    plt.title("Protein Projection Performance (100k ClinVar Variants)", fontsize=18, pad=20)
-    plt.xlabel("Release", fontsize=14)
-    plt.ylabel("Match %", fontsize=14)
-    plt.ylim(85, 100)  # Zoom in on the high performance range
-    plt.xticks(x, versions)
-
-    # Legend cleanup
-    legend = plt.legend(title=None, bbox_to_anchor=(1.02, 1), loc="upper left", borderaxespad=0.0)
-    if mode == "dark":
-        plt.setp(legend.get_texts(), color="#e6edf3")
-
-    plt.tight_layout()
-
-    # Save to SVG string
-    img_data = io.StringIO()
-    plt.savefig(img_data, format="svg", bbox_inches="tight", transparent=True)
-    plt.close()
+    # Stacked Identity + Analogous bars, grouped per version.
+    for i, tool in enumerate(TOOLS):
+        offset = (i - 0.5) * bar_w
+        for j, (_version, identity, analogous) in enumerate(by_tool[tool]):
+            x = plot_left + (j + 0.5) * x_scale + offset - bar_w / 2
+            y_identity = _y(identity)
+            y_analogous = _y(identity + analogous)
+            parts.append(
+                f'<rect class="bar {tool}-Identity" x="{x:.1f}" y="{y_identity:.1f}" '
+                f'width="{bar_w:.1f}" height="{plot_bottom - y_identity:.1f}"/>',
+            )
+            parts.append(
+                f'<rect class="bar {tool}-Analogous" x="{x:.1f}" y="{y_analogous:.1f}" '
+                f'width="{bar_w:.1f}" height="{y_identity - y_analogous:.1f}"/>',
+            )
 
-    svg_val = img_data.getvalue()
-    return svg_val[svg_val.find("<svg") :]
+    # X tick labels and axis titles.
+    for j, version in enumerate(versions):
+        x = plot_left + (j + 0.5) * x_scale
+        label = html.escape(version)
+        parts.append(f'<text x="{x:.1f}" y="{plot_bottom + 20}" font-size="12" text-anchor="middle">{label}</text>')
+    parts.append(
+        f'<text x="{plot_left + PLOT_WIDTH / 2}" y="{plot_bottom + 50}" font-size="14" text-anchor="middle">'
+        "Release</text>",
+    )
+    parts.append(
+        f'<text x="{plot_left - 50}" y="{MARGIN_TOP + PLOT_HEIGHT / 2}" font-size="14" text-anchor="middle" '
+        f'transform="rotate(-90 {plot_left - 50} {MARGIN_TOP + PLOT_HEIGHT / 2})">Match %</text>',
+    )
+
+    # Legend
+    legend_x = plot_right + 20
+    for k, (tool, kind) in enumerate((tool, kind) for tool in TOOLS for kind in ("Identity", "Analogous")):
+        y = MARGIN_TOP + k * 24
+        parts.append(f'<rect class="bar {tool}-{kind}" x="{legend_x}" y="{y}" width="18" height="14"/>')
+        parts.append(f'<text x="{legend_x + 26}" y="{y + 12}" font-size="13">{tool} {kind}</text>')
+
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
 
 
 def update_readme() -> None:
@@ -1,13 +1,45 @@
+import functools
+
 import weaver
 import weaver.cli.provider as p
 
+GFF_PATH = "GRCh38_latest_genomic.gff.gz"
+FASTA_PATH = "GCF_000001405.40_GRCh38.p14_genomic.fna"
+
+
+@functools.lru_cache(maxsize=1)
+def get_mapper(gff_path: str, fasta_path: str) -> weaver.VariantMapper:
+    """Builds the provider and mapper once per process for a given GFF/FASTA pair."""
+    dp = p.RefSeqDataProvider(gff_path=gff_path, fasta_path=fasta_path)
+    return weaver.VariantMapper(dp)
+
+
+def project(mapper: weaver.VariantMapper, var: weaver.Variant) -> tuple[str, str]:
+    """Projects one variant to protein with and without normalization, reporting errors in place."""
+    try:
+        p_no_norm = str(mapper.c_to_p(var))
+    except ValueError as e:
+        return f"ERROR: {e}", f"ERROR: {e}"
+    try:
+        p_with_norm = str(mapper.c_to_p(mapper.normalize_variant(var)))
+    except ValueError as e:
+        p_with_norm = f"ERROR: {e}"
+    return p_no_norm, p_with_norm
+
+
+def project_all(mapper: weaver.VariantMapper, parsed: list[weaver.Variant]) -> list[tuple[str, str]]:
+    """Projects all variants with the batch APIs, falling back to one call per variant if any fails."""
+    try:
+        p_no_norm = mapper.c_to_p_batch(parsed)
+        p_with_norm = mapper.c_to_p_batch(mapper.normalize_variant_batch(parsed))
+    except ValueError:
+        # A batch fails as a whole on its first error; redo it variant by variant so each row reports its own.
+        return [project(mapper, var) for var in parsed]
+    return [(str(raw), str(norm)) for raw, norm in zip(p_no_norm, p_with_norm, strict=True)]
+
 
 def main() -> None:
-    dp = p.RefSeqDataProvider(
-        gff_path="GRCh38_latest_genomic.gff.gz",
-        fasta_path="GCF_000001405.40_GRCh38.p14_genomic.fna",
-    )
-    mapper = weaver.VariantMapper(dp)
+    mapper = get_mapper(GFF_PATH, FASTA_PATH)
 
     variants = [
         ("NM_000038.6:c.1972_1973delinsAT", "p.Glu658Met"),
@@ -20,18 +52,18 @@ def main() -> None:
     print(f"{'Variant':<60} | {'Truth':<50} | {'Weaver (No Norm)':<50} | {'Weaver (With Norm)'}")
     print("-" * 220)
 
+    # Parse row by row so a malformed variant only costs its own row.
+    rows: list[tuple[str, str, weaver.Variant]] = []
     for hgvs_c, truth_p in variants:
         try:
-            var = weaver.parse(hgvs_c)
-            p_no_norm = mapper.c_to_p(var)
-
-            norm_var = mapper.normalize_variant(var)
-            p_with_norm = mapper.c_to_p(norm_var)
-
-            print(f"{hgvs_c:<60} | {truth_p:<50} | {p_no_norm!s:<50} | {p_with_norm}")
-        except OSError as e:
+            rows.append((hgvs_c, truth_p, weaver.parse(hgvs_c)))
+        except ValueError as e:
             print(f"{hgvs_c:<60} | {truth_p:<50} | ERROR: {e}")
 
+    results = project_all(mapper, [var for _, _, var in rows])
+    for (hgvs_c, truth_p, _), (p_no_norm, p_with_norm) in zip(rows, results, strict=True):
+        print(f"{hgvs_c:<60} | {truth_p:<50} | {p_no_norm:<50} | {p_with_norm}")
+
 
 if __name__ == "__main__":
     main()
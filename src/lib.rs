@@ -33,11 +33,11 @@ fn map_hgvs_error(e: HgvsError) -> PyErr {
 #[pyclass(name = "IdentifierType", module = "weaver._weaver")]
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
 pub enum PyIdentifierType {
-    GenomicAccession,
-    TranscriptAccession,
-    ProteinAccession,
-    GeneSymbol,
-    Unknown,
+    GenomicAccession = 0,
+    TranscriptAccession = 1,
+    ProteinAccession = 2,
+    GeneSymbol = 3,
+    Unknown = 4,
 }
 
 impl From<PyIdentifierType> for ::hgvs_weaver::data::IdentifierType {
@@ -90,6 +90,20 @@ impl PyIdentifierType {
         std::hash::Hash::hash(self, &mut s);
         std::hash::Hasher::finish(&s)
     }
+    fn __int__(&self) -> isize {
+        *self as isize
+    }
+}
+
+/// Maps the legacy string spelling of an identifier type returned by a Python provider.
+fn identifier_type_from_str(s: &str) -> ::hgvs_weaver::data::IdentifierType {
+    match s {
+        "genomic_accession" => ::hgvs_weaver::data::IdentifierType::GenomicAccession,
+        "transcript_accession" => ::hgvs_weaver::data::IdentifierType::TranscriptAccession,
+        "protein_accession" => ::hgvs_weaver::data::IdentifierType::ProteinAccession,
+        "gene_symbol" => ::hgvs_weaver::data::IdentifierType::GeneSymbol,
+        _ => ::hgvs_weaver::data::IdentifierType::Unknown,
+    }
 }
 
 #[gen_stub_pyclass_enum]
@@ -306,6 +320,27 @@ fn parse(input: &str) -> PyResult<PyVariant> {
     }
 }
 
+#[gen_stub_pyfunction]
+#[pyfunction]
+#[doc = "Parses a list of HGVS strings in a single call.\n\nEquivalent to calling parse on each string, but crosses the Python/Rust boundary once.\nStrings that fail to parse yield None instead of raising.\n\nArgs:\n    inputs: The HGVS strings to parse.\n\nReturns:\n    A list of Variant objects (or None for malformed inputs), in input order."]
+fn parse_many(inputs: Vec<String>) -> Vec<Option<PyVariant>> {
+    inputs
+        .iter()
+        .map(|input| {
+            ::hgvs_weaver::parse_hgvs_variant(input)
+                .ok()
+                .map(|inner| PyVariant { inner })
+        })
+        .collect()
+}
+
+#[gen_stub_pyfunction]
+#[pyfunction]
+#[doc = "Classifies an identifier by its RefSeq accession prefix.\n\nNC_/NW_/NT_ are genomic, NM_/NR_/XM_/XR_ are transcripts and NP_/XP_ are proteins.\nAnything else is IdentifierType.Unknown; providers decide whether it is a gene symbol.\n\nArgs:\n    identifier: The identifier to classify.\n\nReturns:\n    An IdentifierType enum value."]
+fn classify(identifier: &str) -> PyIdentifierType {
+    ::hgvs_weaver::classify_identifier(identifier).into()
+}
+
 // --- Mapper and DataProvider Bridge ---
 
 pub struct PyDataProviderBridge {
@@ -355,8 +390,17 @@ impl DataProvider for PyDataProviderBridge {
                 .bind(py)
                 .call_method1("get_seq", (ac, start, end, py_kind))
                 .map_err(|e: PyErr| HgvsError::DataProviderError(e.to_string()))?;
-            res.extract::<String>()
-                .map_err(|e: PyErr| HgvsError::DataProviderError(e.to_string()))
+            if let Ok(s) = res.extract::<String>() {
+                return Ok(s);
+            }
+
+            // Otherwise accept any bytes-like object (bytes, memoryview, mmap slices)
+            let buf = pyo3::buffer::PyBuffer::<u8>::get(&res)
+                .map_err(|e: PyErr| HgvsError::DataProviderError(e.to_string()))?;
+            let bytes = buf
+                .to_vec(py)
+                .map_err(|e: PyErr| HgvsError::DataProviderError(e.to_string()))?;
+            String::from_utf8(bytes).map_err(|e| HgvsError::DataProviderError(e.to_string()))
         })
     }
 
@@ -393,22 +437,10 @@ impl DataProvider for PyDataProviderBridge {
 
             let mut result = Vec::new();
             for (type_any, ac) in raw_list {
-                let it = if let Ok(s) = type_any.extract::<String>() {
-                    match s.as_str() {
-                        "genomic_accession" => {
-                            ::hgvs_weaver::data::IdentifierType::GenomicAccession
-                        }
-                        "transcript_accession" => {
-                            ::hgvs_weaver::data::IdentifierType::TranscriptAccession
-                        }
-                        "protein_accession" => {
-                            ::hgvs_weaver::data::IdentifierType::ProteinAccession
-                        }
-                        "gene_symbol" => ::hgvs_weaver::data::IdentifierType::GeneSymbol,
-                        _ => ::hgvs_weaver::data::IdentifierType::Unknown,
-                    }
-                } else if let Ok(py_it) = type_any.extract::<PyIdentifierType>() {
+                let it = if let Ok(py_it) = type_any.extract::<PyIdentifierType>() {
                     py_it.into()
+                } else if let Ok(s) = type_any.extract::<String>() {
+                    identifier_type_from_str(&s)
                 } else {
                     ::hgvs_weaver::data::IdentifierType::Unknown
                 };
@@ -429,24 +461,16 @@ impl DataProvider for PyDataProviderBridge {
                 .call_method1("get_identifier_type", (identifier,))
                 .map_err(|e| HgvsError::DataProviderError(e.to_string()))?;
 
-            // Try to extract as String first (for backward compatibility or simpler mocks)
-            if let Ok(s) = res.extract::<String>() {
-                return Ok(match s.as_str() {
-                    "genomic_accession" => ::hgvs_weaver::data::IdentifierType::GenomicAccession,
-                    "transcript_accession" => {
-                        ::hgvs_weaver::data::IdentifierType::TranscriptAccession
-                    }
-                    "protein_accession" => ::hgvs_weaver::data::IdentifierType::ProteinAccession,
-                    "gene_symbol" => ::hgvs_weaver::data::IdentifierType::GeneSymbol,
-                    _ => ::hgvs_weaver::data::IdentifierType::Unknown,
-                });
+            // The enum is the preferred return type and only needs a type check to extract.
+            if let Ok(py_it) = res.extract::<PyIdentifierType>() {
+                return Ok(py_it.into());
             }
 
-            // Otherwise try to extract as the enum type
-            let py_it: PyIdentifierType = res.extract::<PyIdentifierType>().map_err(|e| {
+            // Fall back to the string spelling (for backward compatibility or simpler mocks)
+            let s: String = res.extract::<String>().map_err(|e| {
                 HgvsError::DataProviderError(format!("Failed to extract IdentifierType: {}", e))
             })?;
-            Ok(py_it.into())
+            Ok(identifier_type_from_str(&s))
         })
     }
 
@@ -622,6 +646,31 @@ impl PyVariantMapper {
         }
     }
 
+    #[pyo3(signature = (vars_c))]
+    #[doc = "Projects a batch of coding cDNA variants (c.) to their protein consequences (p.).\n\nEquivalent to calling c_to_p on each variant, but crosses the Python/Rust boundary once for the whole list.\n\nArgs:\n    vars_c: The coding Variants to project.\n\nReturns:\n    A list of Variant objects in 'p.' coordinates, in input order.\n\nRaises:\n    ValueError: If any variant is not a coding variant or fails to project."]
+    fn c_to_p_batch(
+        &self,
+        _py: Python,
+        vars_c: Vec<PyRef<'_, PyVariant>>,
+    ) -> PyResult<Vec<PyVariant>> {
+        let mapper = VariantMapper::new(self.bridge.as_ref());
+        vars_c
+            .iter()
+            .map(|var_c| {
+                if let SequenceVariant::Coding(v) = &var_c.inner {
+                    let res = mapper.c_to_p(v, None).map_err(map_hgvs_error)?;
+                    Ok(PyVariant {
+                        inner: SequenceVariant::Protein(res),
+                    })
+                } else {
+                    Err(pyo3::exceptions::PyValueError::new_err(
+                        "Expected a coding variant (c.)",
+                    ))
+                }
+            })
+            .collect()
+    }
+
     #[pyo3(signature = (var))]
     #[doc = "Normalizes a variant by shifting it to its 3'-most position.\n\nNormalization is performed in the coordinate space of the input variant.\n\nArgs:\n    var: The Variant object to normalize.\n\nReturns:\n    A new normalized Variant object."]
     fn normalize_variant(&self, _py: Python, var: &PyVariant) -> PyResult<PyVariant> {
@@ -632,6 +681,24 @@ impl PyVariantMapper {
         Ok(PyVariant { inner: res })
     }
 
+    #[pyo3(signature = (vars))]
+    #[doc = "Normalizes a batch of variants by shifting each to its 3'-most position.\n\nEquivalent to calling normalize_variant on each variant, but crosses the Python/Rust boundary once for the whole list.\n\nArgs:\n    vars: The Variant objects to normalize.\n\nReturns:\n    A list of normalized Variant objects, in input order."]
+    fn normalize_variant_batch(
+        &self,
+        _py: Python,
+        vars: Vec<PyRef<'_, PyVariant>>,
+    ) -> PyResult<Vec<PyVariant>> {
+        let mapper = VariantMapper::new(self.bridge.as_ref());
+        vars.iter()
+            .map(|var| {
+                let res = mapper
+                    .normalize_variant(var.inner.clone())
+                    .map_err(map_hgvs_error)?;
+                Ok(PyVariant { inner: res })
+            })
+            .collect()
+    }
+
     #[pyo3(signature = (var1, var2, searcher))]
     #[doc = "Determines if two variants are biologically equivalent.\n\nHandles normalization, cross-coordinate mapping (g. vs c.), and gene symbol expansion.\n\nArgs:\n    var1: The first Variant object.\n    var2: The second Variant object.\n    searcher: An object implementing the TranscriptSearch protocol.\n\nReturns:\n    True if the variants are equivalent, False otherwise."]
     fn equivalent(
@@ -691,6 +758,8 @@ impl PyVariantMapper {
 #[pymodule]
 fn _weaver(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(parse, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_many, m)?)?;
+    m.add_function(wrap_pyfunction!(classify, m)?)?;
     m.add_class::<PyVariant>()?;
     m.add_class::<PyVariantMapper>()?;
     m.add_class::<PyIdentifierType>()?;
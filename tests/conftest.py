@@ -0,0 +1,93 @@
+"""Shared fixtures for the weaver test suite."""
+
+import functools
+import typing
+
+import pytest
+
+import weaver
+
+# Index 10 is c.1.
+_FULL_SEQ = b"A" * 10 + b"ATGGGGCCCAAA" + b"A" * 2000
+_FULL_SEQ_VIEW = memoryview(_FULL_SEQ)
+
+_TRANSCRIPT_TEMPLATE: dict[str, typing.Any] = {
+    "gene": "TEST",
+    "cds_start_index": 10,
+    "cds_end_index": 20,
+    "strand": 1,
+    "reference_accession": "NC_TEST.1",
+    "reference_alignment_method": "splign",
+    "exons": (
+        {
+            "transcript_start": 0,
+            "transcript_end": 100,
+            "reference_start": 1000,
+            "reference_end": 1100,
+            "alt_strand": 1,
+            "cigar": "100=",
+        },
+    ),
+}
+
+
+# (symbol, target_kind) -> accessions. Mixes string and enum identifier types on purpose.
+_SYMBOL_ACCESSIONS: dict[tuple[str, str], list[tuple[typing.Any, str]]] = {
+    ("BRAF", "p"): [("protein_accession", "NP_BRAF.1")],
+    ("BRAF", "c"): [(weaver.IdentifierType.TranscriptAccession, "NM_BRAF.1")],
+    ("BRAF", "g"): [(weaver.IdentifierType.GenomicAccession, "NC_TEST.1")],
+    ("NM_TEST", "p"): [("protein_accession", "NP_TEST.1")],
+}
+
+
+@functools.cache
+def _transcript(ac: str) -> dict[str, typing.Any]:
+    """Builds the mock transcript model once per accession."""
+    return {**_TRANSCRIPT_TEMPLATE, "ac": ac}
+
+
+@functools.cache
+def _identifier_type(identifier: str) -> str | weaver.IdentifierType:
+    """Classifies a mock identifier once per distinct string."""
+    it = weaver.classify(identifier)
+    if it != weaver.IdentifierType.Unknown:
+        return it
+    if identifier in ("BRAF", "NM_TEST") or "." not in identifier:
+        return "gene_symbol"
+    return "unknown"
+
+
+class MockProvider:
+    """Mock DataProvider for testing."""
+
+    def get_transcript(self, ac: str, _ref: str | None) -> dict[str, typing.Any]:
+        """Returns a mock transcript model."""
+        return _transcript(ac)
+
+    def get_seq(self, _ac: str, start: int, end: int, _kind: str | weaver.IdentifierType) -> memoryview:
+        """Returns a mock sequence as a zero-copy view."""
+        return _FULL_SEQ_VIEW[start:end]
+
+    def get_symbol_accessions(self, symbol: str, _s: str, t: str) -> list[tuple[typing.Any, str]]:
+        """Maps mock symbols."""
+        return _SYMBOL_ACCESSIONS.get((symbol, t), [("gene_symbol", symbol)])
+
+    def get_transcripts_for_region(self, _chrom: str, _start: int, _end: int) -> list[str]:
+        """Returns transcripts for a region."""
+        return ["NM_TEST"]
+
+    def get_identifier_type(self, identifier: str) -> str | weaver.IdentifierType:
+        """Identifies mock identifiers."""
+        return _identifier_type(identifier)
+
+
+@pytest.fixture(scope="session")
+def mock_provider() -> MockProvider:
+    """Provides one MockProvider for the whole session."""
+    return MockProvider()
+
+
+@pytest.fixture(scope="session")
+def mock_mapper(mock_provider: MockProvider) -> weaver.VariantMapper:
+    """Provides one VariantMapper over mock_provider for the whole session."""
+    return weaver.VariantMapper(mock_provider)
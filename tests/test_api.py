@@ -52,6 +52,35 @@ def test_parsing() -> None:
     assert v.format() == "NM_0001.1:c.123A>G"
 
 
+def test_parse_many() -> None:
+    """Tests batched parsing, including malformed inputs."""
+    variants = weaver.parse_many(["NM_0001.1:c.123A>G", "not a variant", "NC_0001.1:g.5del"])
+    assert len(variants) == 3
+    assert variants[0] is not None
+    assert variants[0].format() == "NM_0001.1:c.123A>G"
+    assert variants[1] is None
+    assert variants[2] is not None
+    assert variants[2].coordinate_type == "g"
+
+
+def test_classify() -> None:
+    """Tests accession prefix classification."""
+    assert weaver.classify("NC_000001.11") == weaver.IdentifierType.GenomicAccession
+    assert weaver.classify("NM_000051.3") == weaver.IdentifierType.TranscriptAccession
+    assert weaver.classify("XR_001.1") == weaver.IdentifierType.TranscriptAccession
+    assert weaver.classify("NP_000042.3") == weaver.IdentifierType.ProteinAccession
+    assert weaver.classify("BRAF") == weaver.IdentifierType.Unknown
+
+
+def test_identifier_type_int() -> None:
+    """Tests that IdentifierType members have stable integer values."""
+    assert int(weaver.IdentifierType.GenomicAccession) == 0
+    assert int(weaver.IdentifierType.TranscriptAccession) == 1
+    assert int(weaver.IdentifierType.ProteinAccession) == 2
+    assert int(weaver.IdentifierType.GeneSymbol) == 3
+    assert int(weaver.IdentifierType.Unknown) == 4
+
+
 def test_normalization() -> None:
     """Tests variant normalization (3' shifting)."""
     provider = MockProvider()
@@ -75,6 +104,21 @@ def test_c_to_p() -> None:
     assert "p.(Met1Val)" in v_p.format()
 
 
+def test_batch_mapping() -> None:
+    """Tests batched normalization and c. to p. projection."""
+    provider = MockProvider()
+    mapper = weaver.VariantMapper(provider)
+
+    variants = [weaver.parse("NM_TEST:c.1A>G"), weaver.parse("NM_TEST:c.4_5del")]
+    normalized = mapper.normalize_variant_batch(variants)
+    assert [v.format() for v in normalized] == [mapper.normalize_variant(v).format() for v in variants]
+
+    proteins = mapper.c_to_p_batch([weaver.parse("NM_TEST:c.1A>G"), weaver.parse("NM_TEST:c.4G>A")])
+    assert len(proteins) == 2
+    assert "p.(Met1Val)" in proteins[0].format()
+    assert "p.(Gly2Arg)" in proteins[1].format()
+
+
 def test_c_to_g() -> None:
     """Tests c. to g. mapping."""
     provider = MockProvider()
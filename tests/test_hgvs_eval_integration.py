@@ -1,7 +1,10 @@
+import atexit
 import dataclasses
+import functools
 import os
+import pathlib
+import sys
 from collections.abc import Generator
-from typing import Any
 
 import pytest
 
@@ -9,173 +12,161 @@ import weaver
 from weaver.cli.provider import RefSeqDataProvider
 
 # Paths to data files
-REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-GFF_REF_PATH = os.path.join(REPO_ROOT, "tests", "data", "hgvs_eval_reference.gff")
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+GFF_REF_PATH = REPO_ROOT / "tests" / "data" / "hgvs_eval_reference.gff"
 GFF38_PATH = GFF_REF_PATH
-FASTA38_PATH = os.path.join(REPO_ROOT, "GCF_000001405.40_GRCh38.p14_genomic.fna")
+FASTA38_PATH = REPO_ROOT / "GCF_000001405.40_GRCh38.p14_genomic.fna"
 GFF37_PATH = GFF_REF_PATH
-FASTA37_PATH = os.path.join(REPO_ROOT, "GCF_000001405.25_GRCh37.p13_genomic.fna")
-SEQ_CACHE_PATH = os.path.join(REPO_ROOT, "tests", "data", "hgvs_eval_sequences.json")
+FASTA37_PATH = REPO_ROOT / "GCF_000001405.25_GRCh37.p13_genomic.fna"
+SEQ_CACHE_PATH = REPO_ROOT / "tests" / "data" / "hgvs_eval_sequences.json"
 
 
+@functools.cache
 def setup_sequence_mocking() -> None:
     """Sets up WEAVER_SEQ_MODE and WEAVER_SEQ_CACHE based on file availability."""
     if "WEAVER_SEQ_CACHE" not in os.environ:
-        os.environ["WEAVER_SEQ_CACHE"] = SEQ_CACHE_PATH
+        os.environ["WEAVER_SEQ_CACHE"] = str(SEQ_CACHE_PATH)
 
     if "WEAVER_SEQ_MODE" not in os.environ:
-        if os.path.exists(SEQ_CACHE_PATH) and not os.path.exists(FASTA38_PATH):
+        if SEQ_CACHE_PATH.is_file() and not FASTA38_PATH.is_file():
             os.environ["WEAVER_SEQ_MODE"] = "replay"
         else:
             os.environ["WEAVER_SEQ_MODE"] = "live"
 
 
-@dataclasses.dataclass(frozen=True)
+# ids of SequenceProxy instances whose record-mode cache is already scheduled to be saved.
+_SAVE_REGISTERED: set[int] = set()
+
+
+def register_cache_save(provider: RefSeqDataProvider) -> None:
+    """Saves a recording provider's sequence cache once, at interpreter exit."""
+    if provider.fasta.mode == "record" and id(provider.fasta) not in _SAVE_REGISTERED:
+        _SAVE_REGISTERED.add(id(provider.fasta))
+        atexit.register(provider.fasta.save_cache)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class EvalCase:
     input: str
     output_preferred: str
     data: str
 
-
-HGVS_EVAL_CASES: list[Any] = [
-    pytest.param(
-        EvalCase(
-            input="NM_033089.6:c.471_473del",
-            output_preferred="NC_000020.10:g.278701_278703del",
-            data="GRCh37",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NC_000023.10:g.73501562T>C",
-            output_preferred="NR_028379.1:n.345A>G",
-            data="GRCh37|RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NM_001135021.1:c.794T>C",
-            output_preferred="NC_000002.11:g.85616929T>C",
-            data="GRCh37|RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NR_028379.1:n.345A>G",
-            output_preferred="NC_000023.10:g.73501562T>C",
-            data="GRCh37|RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NM_033089.6:c.471_473delGGC",
-            output_preferred="NP_149080.2:p.(Ala158del)",
-            data="RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NM_033089.6:c.471_473delGGC",
-            output_preferred="NM_033089.6:n.495_497del",
-            data="RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NM_033089.6:n.495_497delGGC",
-            output_preferred="NM_033089.6:c.471_473del",
-            data="RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NC_000001.10:g.17345192_17345217delinsTTGGGGCAAGTAAAGGAACAGGTTC",
-            output_preferred="NM_003000.2:c.*159_*184delinsGAACCTGTTCCTTTACTTGCCCCAA",
-            data="GRCh37|RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NM_001135023.1:c.794T>C",
-            output_preferred="NP_001128495.1:p.(Leu265Ser)",
-            data="RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NM_001166478.1:c.35_36insT",
-            output_preferred="NM_001166478.1:c.35dup",
-            data="RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NM_000492.3:c.1520_1522delTCT",
-            output_preferred="NM_000492.3:c.1521_1523del",
-            data="RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NC_000002.11:g.37480321_37480322insT",
-            output_preferred="NC_000002.11:g.37480321dup",
-            data="GRCh37",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NM_001166478.1:c.31del",
-            output_preferred="NM_001166478.1:c.35del",
-            data="RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NC_000020.10:g.278692_278694delGGC",
-            output_preferred="NC_000020.10:g.278701_278703del",
-            data="GRCh37",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NC_000002.11:g.37480321_37480322insT",
-            output_preferred="NC_000002.11:g.37480321dup",
-            data="GRCh37",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NM_005813.3:c.2673insG",
-            output_preferred="NM_005813.3:c.2673dup",
-            data="RefSeq",
-        ),
-    ),
-    pytest.param(
-        EvalCase(
-            input="NP_689699.2:p.(G553E)",
-            output_preferred="NP_689699.2:p.(Gly553Glu)",
-            data="RefSeq",
-        ),
-    ),
-]
+    def __post_init__(self) -> None:
+        # Only a handful of distinct data labels ("GRCh37", "RefSeq", ...); share one string each.
+        object.__setattr__(self, "data", sys.intern(self.data))
+
+
+HGVS_EVAL_CASES: tuple[EvalCase, ...] = (
+    EvalCase(
+        input="NM_033089.6:c.471_473del",
+        output_preferred="NC_000020.10:g.278701_278703del",
+        data="GRCh37",
+    ),
+    EvalCase(
+        input="NC_000023.10:g.73501562T>C",
+        output_preferred="NR_028379.1:n.345A>G",
+        data="GRCh37|RefSeq",
+    ),
+    EvalCase(
+        input="NM_001135021.1:c.794T>C",
+        output_preferred="NC_000002.11:g.85616929T>C",
+        data="GRCh37|RefSeq",
+    ),
+    EvalCase(
+        input="NR_028379.1:n.345A>G",
+        output_preferred="NC_000023.10:g.73501562T>C",
+        data="GRCh37|RefSeq",
+    ),
+    EvalCase(
+        input="NM_033089.6:c.471_473delGGC",
+        output_preferred="NP_149080.2:p.(Ala158del)",
+        data="RefSeq",
+    ),
+    EvalCase(
+        input="NM_033089.6:c.471_473delGGC",
+        output_preferred="NM_033089.6:n.495_497del",
+        data="RefSeq",
+    ),
+    EvalCase(
+        input="NM_033089.6:n.495_497delGGC",
+        output_preferred="NM_033089.6:c.471_473del",
+        data="RefSeq",
+    ),
+    EvalCase(
+        input="NC_000001.10:g.17345192_17345217delinsTTGGGGCAAGTAAAGGAACAGGTTC",
+        output_preferred="NM_003000.2:c.*159_*184delinsGAACCTGTTCCTTTACTTGCCCCAA",
+        data="GRCh37|RefSeq",
+    ),
+    EvalCase(
+        input="NM_001135023.1:c.794T>C",
+        output_preferred="NP_001128495.1:p.(Leu265Ser)",
+        data="RefSeq",
+    ),
+    EvalCase(
+        input="NM_001166478.1:c.35_36insT",
+        output_preferred="NM_001166478.1:c.35dup",
+        data="RefSeq",
+    ),
+    EvalCase(
+        input="NM_000492.3:c.1520_1522delTCT",
+        output_preferred="NM_000492.3:c.1521_1523del",
+        data="RefSeq",
+    ),
+    EvalCase(
+        input="NC_000002.11:g.37480321_37480322insT",
+        output_preferred="NC_000002.11:g.37480321dup",
+        data="GRCh37",
+    ),
+    EvalCase(
+        input="NM_001166478.1:c.31del",
+        output_preferred="NM_001166478.1:c.35del",
+        data="RefSeq",
+    ),
+    EvalCase(
+        input="NC_000020.10:g.278692_278694delGGC",
+        output_preferred="NC_000020.10:g.278701_278703del",
+        data="GRCh37",
+    ),
+    EvalCase(
+        input="NC_000002.11:g.37480321_37480322insT",
+        output_preferred="NC_000002.11:g.37480321dup",
+        data="GRCh37",
+    ),
+    EvalCase(
+        input="NM_005813.3:c.2673insG",
+        output_preferred="NM_005813.3:c.2673dup",
+        data="RefSeq",
+    ),
+    EvalCase(
+        input="NP_689699.2:p.(G553E)",
+        output_preferred="NP_689699.2:p.(Gly553Glu)",
+        data="RefSeq",
+    ),
+)
+
+
+# Parse every case string once, in a single call into the parser.
+_ALL_STRS = sorted(
+    {c.input.strip() for c in HGVS_EVAL_CASES} | {c.output_preferred.strip() for c in HGVS_EVAL_CASES},
+)
+_PARSED = dict(zip(_ALL_STRS, weaver.parse_many(_ALL_STRS), strict=True))
 
 
 @pytest.fixture(scope="session")
-def real_provider_38() -> Generator[RefSeqDataProvider, None, None]:
+def real_provider_38() -> RefSeqDataProvider:
     setup_sequence_mocking()
     mode = os.environ.get("WEAVER_SEQ_MODE", "live")
 
     if mode == "replay":
-        if not os.path.exists(SEQ_CACHE_PATH):
+        if not SEQ_CACHE_PATH.is_file():
             pytest.skip("Sequence cache missing for replay mode")
-    elif not os.path.exists(GFF38_PATH) or not os.path.exists(FASTA38_PATH):
+    elif not GFF38_PATH.is_file() or not FASTA38_PATH.is_file():
         pytest.skip("Real data files (GFF/FASTA) not found. Skipping integration tests.")
 
     print(f"Loading RefSeq provider (mode={mode}) with GFF: {GFF38_PATH}")
-    provider = RefSeqDataProvider(GFF38_PATH, FASTA38_PATH)
-    yield provider
-    if provider.fasta.mode == "record":
-        provider.fasta.save_cache()
+    provider = RefSeqDataProvider(str(GFF38_PATH), str(FASTA38_PATH))
+    register_cache_save(provider)
+    return provider
 
 
 @pytest.fixture(scope="session")
@@ -184,21 +175,20 @@ def real_provider_37() -> Generator[RefSeqDataProvider | None, None, None]:
     mode = os.environ.get("WEAVER_SEQ_MODE", "live")
 
     if mode == "replay":
-        if not os.path.exists(SEQ_CACHE_PATH):
+        if not SEQ_CACHE_PATH.is_file():
             yield None
             return
-    elif not os.path.exists(GFF37_PATH) or not os.path.exists(FASTA37_PATH):
+    elif not GFF37_PATH.is_file() or not FASTA37_PATH.is_file():
         yield None
         return
 
     print(f"Loading RefSeq provider (mode={mode}) with GFF: {GFF37_PATH}")
-    provider = RefSeqDataProvider(GFF37_PATH, FASTA37_PATH)
+    provider = RefSeqDataProvider(str(GFF37_PATH), str(FASTA37_PATH))
+    register_cache_save(provider)
     yield provider
-    if provider.fasta.mode == "record":
-        provider.fasta.save_cache()
 
 
-@pytest.mark.parametrize("hgvs_eval_case", HGVS_EVAL_CASES)
+@pytest.mark.parametrize("hgvs_eval_case", HGVS_EVAL_CASES, ids=lambda c: c.input)
 def test_hgvs_eval_equivalence(
     real_provider_38: RefSeqDataProvider,
     real_provider_37: RefSeqDataProvider | None,
@@ -223,17 +213,11 @@ def test_hgvs_eval_equivalence(
         print(f"SKIPPING {hgvs_eval_case}: Missing input/output strings")
         pytest.skip("Missing input/output strings")
 
-    try:
-        v1 = weaver.parse(input_str)
-        v2 = weaver.parse(output_str)
-
-        if v1 is None or v2 is None:
-            print(f"SKIPPING {input_str}: Transcript missing from provider")
-            pytest.skip(f"Transcript missing from provider: {input_str} or {output_str}")
-
-    except ValueError as e:
-        print(f"SKIPPING {input_str}: Parsing failed: {e}")
-        pytest.skip(f"Parsing failed for {input_str} or {output_str}: {e}")
+    v1 = _PARSED[input_str]
+    v2 = _PARSED[output_str]
+    if v1 is None or v2 is None:
+        print(f"SKIPPING {input_str}: Parsing failed")
+        pytest.skip(f"Parsing failed for {input_str} or {output_str}")
 
     mapper = weaver.VariantMapper(real_provider)
 
@@ -97,31 +97,27 @@ INVALID_VARIANTS = [
 ]
 
 
+def _with_accession(variant_string: str) -> str:
+    """Prepends a dummy accession to a bare variant so only its syntax is under test."""
+    if ":" in variant_string:
+        return variant_string
+    prefix = "NP_000000.0" if variant_string.startswith("p.") else "NM_000000.0"
+    return f"{prefix}:{variant_string}"
+
+
+# weaver strictly requires Accession:Variant, so bare mavehgvs variants are prefixed
+# up front; this still validates their syntax. The whole valid set is parsed once at
+# import with parse_many (None marks a parse failure); the tests only assert on the result.
+_PRE = dict(zip(VALID_VARIANTS, weaver.parse_many([_with_accession(s) for s in VALID_VARIANTS]), strict=True))
+
+
 @pytest.mark.parametrize("variant_string", VALID_VARIANTS)
 def test_valid_mavehgvs_parsing(variant_string: str) -> None:
     """Ensure weaver can parse variants considered valid by mavehgvs."""
-    # Some mavehgvs variants might depend on specific features not yet in weaver.
-    # We allow failures for now but document them.
-    try:
-        v = weaver.parse(variant_string)
-        assert v is not None
-        assert str(v)  # Should verify formatting too
-    except ValueError as e:
-        # weaver strictly requires Accession:Variant. Try prepending a dummy accession
-        # if one is missing, to verify the variant syntax itself.
-        if ":" not in variant_string:
-            prefix = "NP_000000.0" if variant_string.startswith("p.") else "NM_000000.0"
-            retry_string = f"{prefix}:{variant_string}"
-            try:
-                v = weaver.parse(retry_string)
-                assert v is not None
-                # Passing with modification is acceptable for compatibility checking
-                return
-            except ValueError as e2:
-                pytest.fail(f"Failed to parse valid variant {variant_string} (even with prefix {retry_string}): {e2}")
-
-        # If it had a colon or failed even with prefix
-        pytest.fail(f"Failed to parse valid variant {variant_string}: {e}")
+    v = _PRE[variant_string]
+    if v is None:
+        pytest.fail(f"Failed to parse valid variant {variant_string} (as {_with_accession(variant_string)})")
+    assert str(v)
 
 
 @pytest.mark.parametrize("variant_string", XFAIL_VARIANTS)
@@ -130,11 +126,7 @@ def test_mavehgvs_xfail(variant_string: str) -> None:
     """Ensure these variants fail as expected (documentation of gaps)."""
     # If they start passing, we want to know (strict=True by default in recent pytest?)
     # We simulate the same logic as valid variants
-    if ":" not in variant_string:
-        prefix = "NP_000000.0" if variant_string.startswith("p.") else "NM_000000.0"
-        variant_string = f"{prefix}:{variant_string}"
-
-    weaver.parse(variant_string)
+    weaver.parse(_with_accession(variant_string))
 
 
 @pytest.mark.parametrize("variant_string", INVALID_VARIANTS)
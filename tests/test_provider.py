@@ -0,0 +1,70 @@
+"""Tests for the RefSeq data provider helpers."""
+
+import json
+import pathlib
+
+import pytest
+
+from weaver.cli.provider import MmapFastaFile, SequenceProxy, _format_cache_key, _parse_cache_key
+
+SEQS = {
+    "NC_TEST.1": "ACGTACGTAC" * 13 + "GGC",
+    "NC_SHORT.1": "TTAG",
+}
+
+
+@pytest.fixture
+def fasta_path(tmp_path: pathlib.Path) -> str:
+    """Writes a small wrapped FASTA with a matching .fai index."""
+    line_bases = 60
+    fasta = ""
+    fai = []
+    for name, seq in SEQS.items():
+        fasta += f">{name} test\n"
+        offset = len(fasta)
+        for i in range(0, len(seq), line_bases):
+            fasta += seq[i : i + line_bases] + "\n"
+        fai.append(f"{name}\t{len(seq)}\t{offset}\t{line_bases}\t{line_bases + 1}\n")
+    path = tmp_path / "test.fna"
+    path.write_text(fasta)
+    (tmp_path / "test.fna.fai").write_text("".join(fai))
+    return str(path)
+
+
+def test_mmap_fasta_fetch(fasta_path: str) -> None:
+    """Tests slicing across line breaks and open-ended fetches."""
+    fasta = MmapFastaFile(fasta_path)
+    assert fasta.references == list(SEQS)
+
+    seq = SEQS["NC_TEST.1"]
+    assert fasta.fetch("NC_TEST.1", 55, 125) == seq[55:125]
+    assert fasta.fetch("NC_TEST.1", 120) == seq[120:]
+    assert fasta.fetch("NC_TEST.1", 0, -1) == seq
+    assert fasta.fetch("NC_TEST.1", 10, 10) == ""
+    assert fasta.fetch("NC_SHORT.1", 1, 3) == "TA"
+
+
+def test_mmap_fasta_unknown_reference(fasta_path: str) -> None:
+    """Tests that unknown references raise KeyError."""
+    fasta = MmapFastaFile(fasta_path)
+    with pytest.raises(KeyError):
+        fasta.fetch("NC_MISSING.1", 0, 10)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [("NC_TEST.1", 5, 10), ("NC_TEST.1", -5, 10), ("NC_TEST.1", -5, None), ("NC_TEST.1", 0, None)],
+)
+def test_cache_key_round_trip(key: tuple[str, int, int | None]) -> None:
+    """Tests that cache keys survive formatting and parsing, including negative starts."""
+    assert _parse_cache_key(_format_cache_key(key)) == key
+
+
+def test_replay_skips_malformed_cache_keys(tmp_path: pathlib.Path) -> None:
+    """Tests that a malformed key only drops its own entry from a replayed cache."""
+    cache_path = tmp_path / "seqs.json"
+    cache_path.write_text(json.dumps({"NC_TEST.1:-5-10": "ACGT", "NC_TEST.1:1-x": "A", "bogus": "C"}))
+    proxy = SequenceProxy("missing.fna", cache_path=str(cache_path), mode="replay")
+    assert proxy.cache == {("NC_TEST.1", -5, 10): "ACGT"}
+    assert proxy.fetch("NC_TEST.1", -5, 10) == "ACGT"
+    assert proxy.references == ["NC_TEST.1"]
@@ -3,21 +3,82 @@ import sys
 
 from weaver.cli.provider import RefSeqDataProvider
 
-
-def verify_equivalence(results_file: str) -> None:
-    provider = RefSeqDataProvider(
-        gff_path="GRCh38_latest_genomic.gff.gz",
-        fasta_path="GCF_000001405.40_GRCh38.p14_genomic.fna",
-    )
+# Number of real differences printed in full before only counting them.
+MAX_EXAMPLES = 5
+
+
+def _trim(pos: int, delseq: str, insseq: str) -> tuple[int, str, str]:
+    """Strips the common prefix and suffix shared by the deleted and inserted sequences."""
+    n = min(len(delseq), len(insseq))
+    prefix = 0
+    while prefix < n and delseq[prefix] == insseq[prefix]:
+        prefix += 1
+    delseq, insseq = delseq[prefix:], insseq[prefix:]
+    n -= prefix
+    suffix = 0
+    while suffix < n and delseq[-1 - suffix] == insseq[-1 - suffix]:
+        suffix += 1
+    if suffix:
+        delseq, insseq = delseq[:-suffix], insseq[:-suffix]
+    return pos + prefix, delseq, insseq
+
+
+def _is_equivalent(
+    provider: RefSeqDataProvider,
+    ac: str,
+    t_edit: tuple[int, str, str],
+    w_edit: tuple[int, str, str],
+) -> bool:
+    """Decides equivalence from the trimmed edits, consulting the reference only when needed."""
+    t_trimmed = _trim(*t_edit)
+    w_trimmed = _trim(*w_edit)
+    if t_trimmed == w_trimmed:
+        return True
+    # Edits with different net length change can never produce the same sequence.
+    if len(t_trimmed[2]) - len(t_trimmed[1]) != len(w_trimmed[2]) - len(w_trimmed[1]):
+        return False
+    return _apply_to_reference(provider, ac, t_trimmed, w_trimmed)
+
+
+def _apply_to_reference(
+    provider: RefSeqDataProvider,
+    ac: str,
+    t_edit: tuple[int, str, str],
+    w_edit: tuple[int, str, str],
+) -> bool:
+    """Checks whether two (pos, del, ins) edits yield the same sequence when applied to the reference."""
+    t_pos, t_del, t_ins = t_edit
+    w_pos, w_del, w_ins = w_edit
+
+    # Both results share the reference outside [start, end), so only that window can differ.
+    start = min(t_pos, w_pos)
+    end = max(t_pos + len(t_del), w_pos + len(w_del))
+    ref_seq = provider.get_seq(ac, start, end, "g")
+
+    t_rel_pos = t_pos - start
+    w_rel_pos = w_pos - start
+    t_seq = ref_seq[:t_rel_pos] + t_ins + ref_seq[t_rel_pos + len(t_del) :]
+    w_seq = ref_seq[:w_rel_pos] + w_ins + ref_seq[w_rel_pos + len(w_del) :]
+    return t_seq == w_seq
+
+
+def verify_equivalence(results_file: str, provider: RefSeqDataProvider) -> None:
     mismatches = 0
     equivalent = 0
     real_diff = 0
 
-    with open(results_file) as f:
-        reader = csv.DictReader(f, delimiter="\t")
+    with open(results_file, newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        header = next(reader)
+        idx_spdi = header.index("spdi")
+        idx_rs = header.index("rs_spdi")
+        idx_var = header.index("variant_nuc")
+        min_len = max(idx_spdi, idx_rs, idx_var) + 1
         for i, row in enumerate(reader):
-            truth = row["spdi"]
-            weaver_spdi = row["rs_spdi"]
+            if len(row) < min_len:
+                continue
+            truth = row[idx_spdi]
+            weaver_spdi = row[idx_rs]
 
             if not truth or not weaver_spdi or weaver_spdi.startswith("ERR:"):
                 continue
@@ -30,43 +91,24 @@ def verify_equivalence(results_file: str) -> None:
             # Verify equivalence
             # SPDI: ac:pos:del:ins
             try:
-                t_parts = truth.split(":")
-                w_parts = weaver_spdi.split(":")
+                t_ac, t_pos_str, t_del, t_ins = truth.split(":", 3)
+                w_ac, w_pos_str, w_del, w_ins = weaver_spdi.split(":", 3)
 
-                if t_parts[0] != w_parts[0]:
+                if t_ac != w_ac:
                     real_diff += 1
                     continue
 
-                ac = t_parts[0]
-                t_pos, t_del, t_ins = int(t_parts[1]), t_parts[2], t_parts[3]
-                w_pos, w_del, w_ins = int(w_parts[1]), w_parts[2], w_parts[3]
-
-                # Check if applying both to reference yields same result
-                # We need a bit of context sequence
-                start = min(t_pos, w_pos)
-                end = max(t_pos + len(t_del), w_pos + len(w_del))
-                padding = 50
-
-                context_start = max(0, start - padding)
-                context_end = end + padding
+                # Few hundred distinct accessions; share one string per accession.
+                ac = sys.intern(t_ac)
+                t_edit = (int(t_pos_str), t_del, t_ins)
+                w_edit = (int(w_pos_str), w_del, w_ins)
 
-                ref_seq = provider.get_seq(ac, context_start, context_end, "g")
-
-                # Apply T
-                t_rel_pos = t_pos - context_start
-                t_seq = ref_seq[0:t_rel_pos] + t_ins + ref_seq[t_rel_pos + len(t_del) :]
-
-                # Apply W
-                w_rel_pos = w_pos - context_start
-                w_seq = ref_seq[0:w_rel_pos] + w_ins + ref_seq[w_rel_pos + len(w_del) :]
-
-                if t_seq == w_seq:
+                if _is_equivalent(provider, ac, t_edit, w_edit):
                     equivalent += 1
                 else:
                     real_diff += 1
-                    max_examples = 5
-                    if real_diff <= max_examples:
-                        print(f"Mismatch {i}: {row['variant_nuc']}")
+                    if real_diff <= MAX_EXAMPLES:
+                        print(f"Mismatch {i}: {row[idx_var]}")
                         print(f"  Truth:  {truth}")
                         print(f"  Weaver: {weaver_spdi}")
             except (ValueError, KeyError, IndexError, TypeError):
@@ -83,4 +125,8 @@ if __name__ == "__main__":
     if len(sys.argv) < min_args:
         print("Usage: python verify_spdi_equiv.py <results_file>")
         sys.exit(1)
-    verify_equivalence(sys.argv[1])
+    provider = RefSeqDataProvider(
+        gff_path="GRCh38_latest_genomic.gff.gz",
+        fasta_path="GCF_000001405.40_GRCh38.p14_genomic.fna",
+    )
+    verify_equivalence(sys.argv[1], provider)
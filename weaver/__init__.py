@@ -6,7 +6,9 @@ from ._weaver import (
     TranscriptMismatchError,
     Variant,
     VariantMapper,
+    classify,
     parse,
+    parse_many,
 )
 
 __all__ = [
@@ -19,7 +21,9 @@ __all__ = [
     "TranscriptSearch",
     "Variant",
     "VariantMapper",
+    "classify",
     "parse",
+    "parse_many",
 ]
 
 
@@ -76,8 +80,11 @@ class DataProvider(Protocol):
         """
         ...
 
-    def get_seq(self, ac: str, start: int, end: int, kind: str | IdentifierType) -> str:
-        """Fetch sequence for an accession. kind should be an IdentifierType."""
+    def get_seq(self, ac: str, start: int, end: int, kind: str | IdentifierType) -> str | bytes | memoryview:
+        """Fetch sequence for an accession. kind should be an IdentifierType.
+
+        The sequence may be returned as a str or as any ASCII bytes-like object.
+        """
         ...
 
     def get_symbol_accessions(
@@ -89,20 +96,18 @@ class DataProvider(Protocol):
         """Map identifiers between different namespaces.
 
         Returns a list of tuples (identifier_type, accession).
-        identifier_type should be one of 'genomic_accession', 'transcript_accession',
-        'protein_accession', 'gene_symbol', or a member of the IdentifierType enum.
+        identifier_type should be a member of the IdentifierType enum; the strings
+        'genomic_accession', 'transcript_accession', 'protein_accession' and
+        'gene_symbol' are still accepted but cost an extra conversion per entry.
         """
         ...
 
     def get_identifier_type(self, identifier: str) -> str | IdentifierType:
         """Identify what type of identifier a string is.
 
-        Should return one of:
-        - 'genomic_accession'
-        - 'transcript_accession'
-        - 'protein_accession'
-        - 'gene_symbol'
-        - 'unknown'
-        Or the equivalent IdentifierType enum value.
+        Should return an IdentifierType enum value (see also `classify`, which
+        handles RefSeq accession prefixes). For backward compatibility one of
+        'genomic_accession', 'transcript_accession', 'protein_accession',
+        'gene_symbol' or 'unknown' is also accepted.
         """
         ...
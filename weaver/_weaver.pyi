@@ -120,6 +120,21 @@ class VariantMapper:
         Returns:
             A new Variant object in 'p.' coordinates.
         """
+    def c_to_p_batch(self, vars_c: builtins.list[Variant]) -> builtins.list[Variant]:
+        r"""
+        Projects a batch of coding cDNA variants (c.) to their protein consequences (p.).
+
+        Equivalent to calling c_to_p on each variant, but crosses the Python/Rust boundary once for the whole list.
+
+        Args:
+            vars_c: The coding Variants to project.
+
+        Returns:
+            A list of Variant objects in 'p.' coordinates, in input order.
+
+        Raises:
+            ValueError: If any variant is not a coding variant or fails to project.
+        """
     def normalize_variant(self, var: Variant) -> Variant:
         r"""
         Normalizes a variant by shifting it to its 3'-most position.
@@ -132,6 +147,18 @@ class VariantMapper:
         Returns:
             A new normalized Variant object.
         """
+    def normalize_variant_batch(self, vars: builtins.list[Variant]) -> builtins.list[Variant]:
+        r"""
+        Normalizes a batch of variants by shifting each to its 3'-most position.
+
+        Equivalent to calling normalize_variant on each variant, but crosses the Python/Rust boundary once for the whole list.
+
+        Args:
+            vars: The Variant objects to normalize.
+
+        Returns:
+            A list of normalized Variant objects, in input order.
+        """
     def equivalent(self, var1: Variant, var2: Variant, searcher: typing.Any) -> builtins.bool:
         r"""
         Determines if two variants are biologically equivalent.
@@ -196,6 +223,21 @@ class IdentifierType(enum.Enum):
 
     def __eq__(self, other: builtins.object) -> builtins.bool: ...
     def __hash__(self) -> builtins.int: ...
+    def __int__(self) -> builtins.int: ...
+
+def classify(identifier: builtins.str) -> IdentifierType:
+    r"""
+    Classifies an identifier by its RefSeq accession prefix.
+
+    NC_/NW_/NT_ are genomic, NM_/NR_/XM_/XR_ are transcripts and NP_/XP_ are proteins.
+    Anything else is IdentifierType.Unknown; providers decide whether it is a gene symbol.
+
+    Args:
+        identifier: The identifier to classify.
+
+    Returns:
+        An IdentifierType enum value.
+    """
 
 def parse(input: builtins.str) -> Variant:
     r"""
@@ -213,3 +255,17 @@ def parse(input: builtins.str) -> Variant:
     Raises:
         ValueError: If the HGVS string is malformed or unsupported.
     """
+
+def parse_many(inputs: builtins.list[builtins.str]) -> builtins.list[Variant | None]:
+    r"""
+    Parses a list of HGVS strings in a single call.
+
+    Equivalent to calling parse on each string, but crosses the Python/Rust boundary once.
+    Strings that fail to parse yield None instead of raising.
+
+    Args:
+        inputs: The HGVS strings to parse.
+
+    Returns:
+        A list of Variant objects (or None for malformed inputs), in input order.
+    """
@@ -2,22 +2,51 @@
 
 import argparse
 import csv
+import functools
 import re
+import typing
 from pathlib import Path
 
+_RESULTS_HEADER_RE = re.compile(r"### Validation Results \([^)]*\)")
+_RESULTS_SECTION_END = "\n- **Variant Equivalence**"
+_DEL_PARENS = str.maketrans("", "", "()")
+
+_AGREEMENT_TEMPLATE = (
+    "|                     | ref-hgvs Match | ref-hgvs Mismatch |\n"
+    "| :------------------ | :------------: | :---------------: |\n"
+    "| **weaver Match**    |     {both:,}     |     {rs_only:,}     |\n"
+    "| **weaver Mismatch** |     {ref_only:,}     |     {neither:,}     |"
+)
+_REPORT_TEMPLATE = (
+    "### Validation Results ({total:,} variants)\n"
+    "\n"
+    "Summary of results comparing `weaver` and `ref-hgvs` against ClinVar ground truth:\n"
+    "\n"
+    "| Implementation | Protein Match | SPDI Match  | Parse Errors |\n"
+    "| :------------- | :-----------: | :---------: | :----------: |\n"
+    "| weaver         |  {rs_p}  | {rs_spdi} | {rs_err} |\n"
+    "| ref-hgvs       |  {ref_p}  | {ref_spdi} | {ref_err} |\n"
+    "\n"
+    "RefSeq Data Mismatches: {rs_ref_mismatch:,} ({rs_ref_mismatch_pct:.1f}%)\n"
+    "\n"
+    "#### Protein Translation Agreement\n"
+    "\n"
+    "{p_table}\n"
+    "\n"
+    "#### SPDI Mapping Agreement\n"
+    "\n"
+    "{spdi_table}"
+)
+
 
 def clean_hgvs(s: str) -> str:
-    if not s:
-        return ""
-    # Remove accession prefix
-    if ":" in s:
-        s = s.split(":")[-1]
-    # Remove parentheses
-    s = s.replace("(", "").replace(")", "")
-    # Standardize Ter/*
-    return s.replace("Ter", "*")
+    # Remove accession prefix (rpartition yields the whole string when there is no colon),
+    # drop parentheses in one translate pass and standardize Ter/*.
+    return s.rpartition(":")[2].translate(_DEL_PARENS).replace("Ter", "*")
 
 
+# Predictions and ClinVar proteins repeat heavily (p.?, p.=, common variants), so most pairs are cache hits.
+@functools.lru_cache(maxsize=1 << 16)
 def is_p_match(pred: str, truth: str) -> bool:
     """Checks if predicted protein matches truth."""
     if not pred or pred.startswith("ERR:"):
@@ -27,145 +56,154 @@ def is_p_match(pred: str, truth: str) -> bool:
     return p == t
 
 
-def main() -> None:
-    """Main analysis entry point."""
-    parser = argparse.ArgumentParser(description="Analyze full HGVS validation results.")
-    parser.add_argument("input_file", help="Input validation TSV file.")
-    parser.add_argument(
-        "--update-readme",
-        action="store_true",
-        help="Update the project README.md with the latest results.",
-    )
-    args = parser.parse_args()
+class ResultCounts(typing.NamedTuple):
+    """Every counter the validation report is built from."""
+
+    total: int
+    rs_p_match: int
+    ref_p_match: int
+    rs_spdi_match: int
+    ref_spdi_match: int
+    rs_parse_err: int
+    ref_parse_err: int
+    rs_ref_mismatch: int
+    # Cross-tabs keyed by "both", "rs_only", "ref_only" and "neither".
+    p_stats: dict[str, int]
+    spdi_stats: dict[str, int]
+
 
-    total = 0
-    rs_p_match = 0
-    ref_p_match = 0
-    rs_spdi_match = 0
-    ref_spdi_match = 0
+def _stats(counts: list[int]) -> dict[str, int]:
+    """Maps a 4-bucket list indexed by (ref_ok << 1) | rs_ok to named cross-tab cells."""
+    return {"both": counts[3], "rs_only": counts[1], "ref_only": counts[2], "neither": counts[0]}
 
+
+def tally_results(input_file: str) -> ResultCounts:
+    """Computes all report counters in a single streaming pass over a validation TSV."""
     rs_parse_err = 0
     ref_parse_err = 0
     rs_ref_mismatch = 0
 
-    p_stats = {"both": 0, "rs_only": 0, "ref_only": 0, "neither": 0}
-    spdi_stats = {"both": 0, "rs_only": 0, "ref_only": 0, "neither": 0}
-
-    with open(args.input_file) as f:
-        reader = csv.DictReader(f, delimiter="\t")
+    # Cross-tab buckets indexed by (ref_ok << 1) | rs_ok; the match totals and row count derive from them.
+    p_counts = [0, 0, 0, 0]
+    spdi_counts = [0, 0, 0, 0]
+    # Bind the per-row helper locally so the loop uses fast local loads instead of global lookups.
+    p_match = is_p_match
+
+    with open(input_file, buffering=1 << 20, newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        header = next(reader, None)
+        if header is None:
+            # Empty file
+            return ResultCounts(0, 0, 0, 0, 0, 0, 0, 0, _stats(p_counts), _stats(spdi_counts))
+        idx_cv_p = header.index("variant_prot")
+        idx_cv_spdi = header.index("spdi")
+        idx_rs_p = header.index("rs_p")
+        idx_ref_p = header.index("ref_p")
+        idx_rs_spdi = header.index("rs_spdi")
+        idx_ref_spdi = header.index("ref_spdi")
+        min_len = max(idx_cv_p, idx_cv_spdi, idx_rs_p, idx_ref_p, idx_rs_spdi, idx_ref_spdi) + 1
         for row in reader:
-            total += 1
+            # Blank or truncated line
+            if len(row) < min_len:
+                continue
 
             # ClinVar truth
-            cv_p = row["variant_prot"]
-            cv_spdi = row["spdi"]
+            cv_p = row[idx_cv_p]
+            cv_spdi = row[idx_cv_spdi]
 
             # Analysis
-            rs_p_raw = row["rs_p"]
-            ref_p_raw = row["ref_p"]
+            rs_p_raw = row[idx_rs_p]
+            ref_p_raw = row[idx_ref_p]
 
-            if rs_p_raw.startswith("ERR:RefMismatch"):
-                rs_ref_mismatch += 1
-            if rs_p_raw.startswith("ERR:Parse"):
-                rs_parse_err += 1
-            if ref_p_raw.startswith("ERR:Parse"):
-                ref_parse_err += 1
+            # Most predictions are not errors, so one prefix check settles the common case.
+            if rs_p_raw.startswith("ERR:"):
+                rs_ref_mismatch += rs_p_raw.startswith("ERR:RefMismatch")
+                rs_parse_err += rs_p_raw.startswith("ERR:Parse")
+            ref_parse_err += ref_p_raw.startswith("ERR:Parse")
 
             # Protein matches
-            rs_p_ok = is_p_match(rs_p_raw, cv_p)
-            ref_p_ok = is_p_match(ref_p_raw, cv_p)
-
-            if rs_p_ok:
-                rs_p_match += 1
-            if ref_p_ok:
-                ref_p_match += 1
-
-            if rs_p_ok and ref_p_ok:
-                p_stats["both"] += 1
-            elif rs_p_ok:
-                p_stats["rs_only"] += 1
-            elif ref_p_ok:
-                p_stats["ref_only"] += 1
-            else:
-                p_stats["neither"] += 1
+            p_counts[(p_match(ref_p_raw, cv_p) << 1) | p_match(rs_p_raw, cv_p)] += 1
 
             # SPDI matches
-            rs_spdi_ok = row["rs_spdi"] == cv_spdi
-            ref_spdi_ok = row["ref_spdi"] == cv_spdi
-
-            if rs_spdi_ok:
-                rs_spdi_match += 1
-            if ref_spdi_ok:
-                ref_spdi_match += 1
-
-            if rs_spdi_ok and ref_spdi_ok:
-                spdi_stats["both"] += 1
-            elif rs_spdi_ok:
-                spdi_stats["rs_only"] += 1
-            elif ref_spdi_ok:
-                spdi_stats["ref_only"] += 1
-            else:
-                spdi_stats["neither"] += 1
+            spdi_counts[((row[idx_ref_spdi] == cv_spdi) << 1) | (row[idx_rs_spdi] == cv_spdi)] += 1
+
+    return ResultCounts(
+        total=sum(p_counts),
+        rs_p_match=p_counts[1] + p_counts[3],
+        ref_p_match=p_counts[2] + p_counts[3],
+        rs_spdi_match=spdi_counts[1] + spdi_counts[3],
+        ref_spdi_match=spdi_counts[2] + spdi_counts[3],
+        rs_parse_err=rs_parse_err,
+        ref_parse_err=ref_parse_err,
+        rs_ref_mismatch=rs_ref_mismatch,
+        p_stats=_stats(p_counts),
+        spdi_stats=_stats(spdi_counts),
+    )
+
 
-    if total == 0:
+def _bold_higher(rs_value: float, ref_value: float, rs_text: str, ref_text: str) -> tuple[str, str]:
+    """Wraps the text of the strictly higher value in Markdown bold; ties stay plain."""
+    if rs_value > ref_value:
+        return f"**{rs_text}**", ref_text
+    if ref_value > rs_value:
+        return rs_text, f"**{ref_text}**"
+    return rs_text, ref_text
+
+
+def main() -> None:
+    """Main analysis entry point."""
+    parser = argparse.ArgumentParser(description="Analyze full HGVS validation results.")
+    parser.add_argument("input_file", help="Input validation TSV file.")
+    parser.add_argument(
+        "--update-readme",
+        action="store_true",
+        help="Update the project README.md with the latest results.",
+    )
+    args = parser.parse_args()
+
+    counts = tally_results(args.input_file)
+
+    if counts.total == 0:
         print("No variants processed.")
         return
 
     # Calculate percentages
-    rs_p_pct = rs_p_match / total * 100
-    ref_p_pct = ref_p_match / total * 100
-    rs_spdi_pct = rs_spdi_match / total * 100
-    ref_spdi_pct = ref_spdi_match / total * 100
+    rs_p_pct = counts.rs_p_match / counts.total * 100
+    ref_p_pct = counts.ref_p_match / counts.total * 100
+    rs_spdi_pct = counts.rs_spdi_match / counts.total * 100
+    ref_spdi_pct = counts.ref_spdi_match / counts.total * 100
 
     # Determine bolds
-    rs_p_str = f"{rs_p_pct:.3f}%"
-    ref_p_str = f"{ref_p_pct:.3f}%"
-    if rs_p_pct > ref_p_pct:
-        rs_p_str = f"**{rs_p_str}**"
-    elif ref_p_pct > rs_p_pct:
-        ref_p_str = f"**{ref_p_str}**"
-
-    rs_spdi_str = f"{rs_spdi_pct:.3f}%"
-    ref_spdi_str = f"{ref_spdi_pct:.3f}%"
-    if rs_spdi_pct > ref_spdi_pct:
-        rs_spdi_str = f"**{rs_spdi_str}**"
-    elif ref_spdi_pct > rs_spdi_pct:
-        ref_spdi_str = f"**{ref_spdi_str}**"
-
-    rs_err_str = f"{rs_parse_err:,}"
-    ref_err_str = f"{ref_parse_err:,}"
-    if rs_parse_err < ref_parse_err:
-        rs_err_str = f"**{rs_err_str}**"
-    elif ref_parse_err < rs_parse_err:
-        ref_err_str = f"**{ref_err_str}**"
-
-    report = []
-    report.append(f"### Validation Results ({total:,} variants)")
-    report.append("")
-    report.append("Summary of results comparing `weaver` and `ref-hgvs` against ClinVar ground truth:")
-    report.append("")
-    report.append("| Implementation | Protein Match | SPDI Match  | Parse Errors |")
-    report.append("| :------------- | :-----------: | :---------: | :----------: |")
-    report.append(f"| weaver         |  {rs_p_str}  | {rs_spdi_str} | {rs_err_str} |")
-    report.append(f"| ref-hgvs       |  {ref_p_str}  | {ref_spdi_str} | {ref_err_str} |")
-    report.append("")
-    report.append(f"RefSeq Data Mismatches: {rs_ref_mismatch:,} ({rs_ref_mismatch / total * 100:.1f}%)")
-    report.append("")
-    report.append("#### Protein Translation Agreement")
-    report.append("")
-    report.append("|                     | ref-hgvs Match | ref-hgvs Mismatch |")
-    report.append("| :------------------ | :------------: | :---------------: |")
-    report.append(f"| **weaver Match**    |     {p_stats['both']:,}     |     {p_stats['rs_only']:,}     |")
-    report.append(f"| **weaver Mismatch** |     {p_stats['ref_only']:,}     |     {p_stats['neither']:,}     |")
-    report.append("")
-    report.append("#### SPDI Mapping Agreement")
-    report.append("")
-    report.append("|                     | ref-hgvs Match | ref-hgvs Mismatch |")
-    report.append("| :------------------ | :------------: | :---------------: |")
-    report.append(f"| **weaver Match**    |     {spdi_stats['both']:,}     |     {spdi_stats['rs_only']:,}     |")
-    report.append(f"| **weaver Mismatch** |     {spdi_stats['ref_only']:,}     |     {spdi_stats['neither']:,}     |")
-
-    out_text = "\n".join(report)
+    rs_p_str, ref_p_str = _bold_higher(rs_p_pct, ref_p_pct, f"{rs_p_pct:.3f}%", f"{ref_p_pct:.3f}%")
+    rs_spdi_str, ref_spdi_str = _bold_higher(
+        rs_spdi_pct,
+        ref_spdi_pct,
+        f"{rs_spdi_pct:.3f}%",
+        f"{ref_spdi_pct:.3f}%",
+    )
+    # Fewer parse errors is better.
+    rs_err_str, ref_err_str = _bold_higher(
+        -counts.rs_parse_err,
+        -counts.ref_parse_err,
+        f"{counts.rs_parse_err:,}",
+        f"{counts.ref_parse_err:,}",
+    )
+
+    out_text = _REPORT_TEMPLATE.format_map(
+        {
+            "total": counts.total,
+            "rs_p": rs_p_str,
+            "ref_p": ref_p_str,
+            "rs_spdi": rs_spdi_str,
+            "ref_spdi": ref_spdi_str,
+            "rs_err": rs_err_str,
+            "ref_err": ref_err_str,
+            "rs_ref_mismatch": counts.rs_ref_mismatch,
+            "rs_ref_mismatch_pct": counts.rs_ref_mismatch / counts.total * 100,
+            "p_table": _AGREEMENT_TEMPLATE.format_map(counts.p_stats),
+            "spdi_table": _AGREEMENT_TEMPLATE.format_map(counts.spdi_stats),
+        },
+    )
     print(out_text)
 
     if args.update_readme:
@@ -176,12 +214,15 @@ def main() -> None:
 
         if readme_path.exists():
             content = readme_path.read_text()
-            # Regex to find the section from ### Validation Results until the next section (starting with - **Variant Equivalence**)
-            # or end of file.
-            pattern = re.compile(r"### Validation Results \(.*?\).*?(?=\n- \*\*Variant Equivalence\*\*)", re.DOTALL)
-            if pattern.search(content):
-                new_content = pattern.sub(out_text.replace("\\", "\\\\"), content)
-                readme_path.write_text(new_content)
+            # The section runs from the ### Validation Results heading up to the next section
+            # (starting with - **Variant Equivalence**).
+            header = _RESULTS_HEADER_RE.search(content)
+            end = content.find(_RESULTS_SECTION_END, header.end()) if header else -1
+            if header and end != -1:
+                # Write beside the README and rename over it, so an interrupted run never truncates it.
+                tmp_path = readme_path.with_name(readme_path.name + ".tmp")
+                tmp_path.write_text(content[: header.start()] + out_text + content[end:])
+                tmp_path.replace(readme_path)
                 print(f"\n[Updated {readme_path}]")
             else:
                 print("\n[Error: Could not find Validation Results section in README.md]")
@@ -1,10 +1,15 @@
 "RefSeq data provider implementation."
 
+import bisect
 import collections
+import functools
 import gzip
+import itertools
 import json
 import logging
+import mmap
 import os
+import re
 import sys
 import typing
 
@@ -19,16 +24,77 @@ except ImportError:
     )
     sys.exit(1)
 
+try:
+    # Optional: python-isal's igzip is a drop-in for gzip that inflates large GFFs about twice as fast.
+    from isal import igzip
+
+    _gzip_open = igzip.open
+except ImportError:
+    _gzip_open = gzip.open
+
 try:
     import pysam
 except ImportError:
     print("Error: 'pysam' package not found. Please install it manually with: pip install pysam")
     sys.exit(1)
 
+import weaver
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Largest genomic span (in bases) SequenceProxy.fetch_many reads in one piece; wider spans are fetched per window.
+_MAX_COALESCED_SPAN = 1 << 20
+
+# Widest transcript window _get_tx_seq serves from exon segments instead of the whole transcript.
+_NARROW_TX_WINDOW = 256
+
+_COMPLEMENT_TABLE = str.maketrans("ACGTNacgtn", "TGCANtgcan")
+# Standard genetic code, codons enumerated in ACGT order (AAA, AAC, AAG, AAT, ACA, ...).
+_GENETIC_CODE = "KNKNTTTTRSRSIIMIQHQHPPPPRRRRLLLLEDEDAAAAGGGGVVVV*Y*YSSSS*CWCLFLF"
+# Maps each byte to a base-5 digit: A/C/G/T (either case) -> 0-3, anything else -> 4.
+_BASE_DIGITS = bytes(b"ACGT".find(bytes([c]).upper()) % 5 for c in range(256))
+# Amino acid per codon, indexed by d0 * 25 + d1 * 5 + d2; any codon with a non-ACGT base translates to "X".
+_CODON_TABLE: tuple[str, ...] = tuple(
+    _GENETIC_CODE[d0 * 16 + d1 * 4 + d2] if max(d0, d1, d2) < 4 else "X"
+    for d0 in range(5)
+    for d1 in range(5)
+    for d2 in range(5)
+)
+
+
+# RNA feature types that define a transcript model.
+_GFF_TRANSCRIPT_TYPES = frozenset(
+    ("mRNA", "transcript", "tRNA", "ncRNA", "lnc_RNA", "rRNA", "scRNA", "snRNA", "snoRNA"),
+)
+_GFF_FEATURE_TYPES = _GFF_TRANSCRIPT_TYPES | {"gene", "exon", "CDS"}
+
+
+def _gff_attribute(attributes: str, key: str) -> str | None:
+    """Returns the value of `key` in a GFF3 attribute column without splitting the whole column."""
+    needle = key + "="
+    i = attributes.find(needle)
+    # Only accept matches at the start of an item, so "ID" does not match inside "Dbxref=...;gene_ID=".
+    while i > 0 and attributes[i - 1] != ";":
+        i = attributes.find(needle, i + 1)
+    if i < 0:
+        return None
+    start = i + len(needle)
+    end = attributes.find(";", start)
+    return attributes[start:] if end < 0 else attributes[start:end]
+
+
+def _reference_start(exon: dict[str, typing.Any]) -> int:
+    return exon["reference_start"]
+
+
+def _negated_reference_start(exon: dict[str, typing.Any]) -> int:
+    return -exon["reference_start"]
+
+
+def _transcript_start(exon: dict[str, typing.Any]) -> int:
+    return exon["transcript_start"]
+
 
 class IdentifierKind:
     """Enum for sequence identifier types."""
@@ -38,6 +104,77 @@ class IdentifierKind:
     Protein = "p"
 
 
+# bytes.translate table mapping lowercase ASCII letters to uppercase.
+_UPPERCASE_BYTES = bytes(range(256)).upper()
+
+
+class FaidxEntry(typing.NamedTuple):
+    """One line of a samtools .fai index."""
+
+    length: int
+    offset: int
+    linebases: int
+    linewidth: int
+
+
+class MmapFastaFile:
+    """Read-only FASTA reader over a memory map of the file, located via its .fai index.
+
+    Exposes the subset of the pysam.FastaFile interface used by SequenceProxy
+    (`references` and `fetch`), but slices are served straight from the page cache.
+    """
+
+    def __init__(self, fasta_path: str) -> None:
+        self.index: dict[str, FaidxEntry] = {}
+        with open(fasta_path + ".fai") as f:
+            for line in f:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) < 5:
+                    continue
+                self.index[fields[0]] = FaidxEntry(int(fields[1]), int(fields[2]), int(fields[3]), int(fields[4]))
+        self.references = list(self.index)
+
+        with open(fasta_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _byte_offset(self, entry: FaidxEntry, pos: int) -> int:
+        line, col = divmod(pos, entry.linebases)
+        return entry.offset + line * entry.linewidth + col
+
+    def fetch(self, reference: str, start: int = 0, end: int | None = None) -> str:
+        """Returns uppercased bases [start, end) of `reference`; end=None or -1 means end-of-reference."""
+        entry = self.index[reference]
+        if end is None or end < 0 or end > entry.length:
+            end = entry.length
+        start = max(start, 0)
+        if start >= end:
+            return ""
+
+        raw = self._mm[self._byte_offset(entry, start) : self._byte_offset(entry, end - 1) + 1]
+        # Uppercase soft-masked bases and drop line breaks in one pass.
+        return raw.translate(_UPPERCASE_BYTES, b"\r\n").decode("ascii")
+
+
+# "AC:start-end" with either bound possibly negative (e.g. "AC:-5-10") and end possibly "None".
+_CACHE_KEY_RE = re.compile(r"(.+):(-?\d+)-(-?\d+|None)")
+
+
+def _format_cache_key(key: tuple[str, int, int | None]) -> str:
+    """Renders an in-memory sequence cache key as its on-disk "AC:start-end" form."""
+    ac, start, end = key
+    return f"{ac}:{start}-{end}"
+
+
+def _parse_cache_key(key: str) -> tuple[str, int, int | None]:
+    """Inverse of _format_cache_key; raises ValueError for malformed keys."""
+    match = _CACHE_KEY_RE.fullmatch(key)
+    if not match:
+        raise ValueError(f"Malformed sequence cache key: {key!r}")
+    ac, start, end = match.groups()
+    # Many windows share an accession; keep one string per accession.
+    return sys.intern(ac), int(start), None if end == "None" else int(end)
+
+
 class SequenceProxy:
     """Proxy for accessing genomic sequences, supporting recording and replay."""
 
@@ -45,7 +182,8 @@ class SequenceProxy:
         self.fasta_path = fasta_path
         self.cache_path = cache_path or os.environ.get("WEAVER_SEQ_CACHE")
         self.mode = mode or os.environ.get("WEAVER_SEQ_MODE", "live")
-        self.cache: dict[str, str] = {}
+        # (ac, start, end or None) -> sequence; stored on disk under "AC:start-end" string keys
+        self.cache: dict[tuple[str, int, int | None], str] = {}
         self.fasta: typing.Any = None
         self.references: list[str] = []
 
@@ -53,29 +191,39 @@ class SequenceProxy:
             if self.cache_path and os.path.exists(self.cache_path):
                 try:
                     with open(self.cache_path) as f:
-                        self.cache = json.load(f)
+                        data = json.load(f)
+                    for key, seq in data.items():
+                        if key.startswith("_"):
+                            continue
+                        try:
+                            self.cache[_parse_cache_key(key)] = seq
+                        except ValueError:
+                            # One bad entry should not cost the rest of the cache.
+                            logger.warning("Skipping malformed sequence cache key %r in %s", key, self.cache_path)
 
                     # Try to get references from manifest first
-                    manifest_data = self.cache.get("_manifest")
+                    manifest_data = data.get("_manifest")
                     if isinstance(manifest_data, dict):
                         manifest = typing.cast("dict[str, list[str]]", manifest_data)
                         fname = os.path.basename(self.fasta_path)
                         if fname in manifest:
                             self.references = manifest[fname]
                     else:
-                        # Fallback: extract unique accessions from keys like "AC:start-end"
-                        refs = set()
-                        for key in self.cache:
-                            if ":" in key and not key.startswith("_"):
-                                refs.add(key.split(":")[0])
-                        self.references = list(refs)
+                        # Fallback: the unique accessions among the cached windows
+                        self.references = list({ac for ac, _, _ in self.cache})
                 except (OSError, json.JSONDecodeError) as e:
                     logger.error("Failed to load sequence cache from %s: %s", self.cache_path, e)
             else:
                 logger.warning("Replay mode enabled but cache file not found: %s", self.cache_path)
         elif os.path.exists(fasta_path):
             try:
-                self.fasta = pysam.FastaFile(fasta_path)
+                if fasta_path.endswith(".gz"):
+                    # BGZF-compressed FASTA can't be memory-mapped; let pysam decompress.
+                    self.fasta = pysam.FastaFile(fasta_path)
+                else:
+                    if not os.path.exists(fasta_path + ".fai"):
+                        pysam.faidx(fasta_path)
+                    self.fasta = MmapFastaFile(fasta_path)
                 self.references = list(self.fasta.references)
             except Exception as e:
                 logger.error("Failed to load FASTA from %s: %s", fasta_path, e)
@@ -84,30 +232,47 @@ class SequenceProxy:
 
     def fetch(self, ac: str, start: int, end: int | None = None) -> str:
         # Normalize end for consistency in the key (None and -1 should be same)
-        key_end = end
-        if end == -1:
-            key_end = None
-        key = f"{ac}:{start}-{key_end}"
+        key = (ac, start, None if end == -1 else end)
 
         if self.mode == "replay":
-            if key in self.cache:
+            try:
                 return self.cache[key]
-            logger.error("Missing sequence in cache for %s", key)
-            return ""
+            except KeyError:
+                logger.error("Missing sequence in cache for %s", _format_cache_key(key))
+                return ""
 
         if not self.fasta:
             return ""
 
         try:
-            # pysam handles end=-1 or None as end-of-ref
-            seq = str(self.fasta.fetch(ac, start, end).upper())
+            # end=-1 or None means end-of-ref
+            seq = self.fasta.fetch(ac, start, end)
+            if not isinstance(self.fasta, MmapFastaFile):
+                # pysam returns soft-masked bases as they are stored; MmapFastaFile already uppercases.
+                seq = str(seq).upper()
             if self.mode == "record":
                 self.cache[key] = seq
             return seq
         except Exception as e:
-            logger.error("Error fetching from FASTA for %s: %s", key, e)
+            logger.error("Error fetching from FASTA for %s: %s", _format_cache_key(key), e)
             return ""
 
+    def fetch_many(self, ac: str, intervals: list[tuple[int, int]]) -> list[str]:
+        """Fetches several [start, end) windows of one reference, reading their whole span at once when small.
+
+        Record and replay modes fetch window by window so the cache keys stay per window.
+        """
+        if self.mode != "live" or not self.fasta or not intervals:
+            return [self.fetch(ac, start, end) for start, end in intervals]
+
+        span_start = min(start for start, _ in intervals)
+        span_end = max(end for _, end in intervals)
+        if span_end - span_start > _MAX_COALESCED_SPAN:
+            return [self.fetch(ac, start, end) for start, end in intervals]
+
+        span = self.fetch(ac, span_start, span_end)
+        return [span[start - span_start : end - span_start] for start, end in intervals]
+
     def save_cache(self) -> None:
         if self.mode == "record" and self.cache_path:
             try:
@@ -117,17 +282,28 @@ class SequenceProxy:
                     with open(self.cache_path) as f:
                         existing = json.load(f)
 
+                recorded = {_format_cache_key(key): seq for key, seq in self.cache.items()}
+                fname = os.path.basename(self.fasta_path)
+                manifest = existing.setdefault("_manifest", {})
+                # Re-recording an already cached run is the common case; leave the file untouched then.
+                if manifest.get(fname) == self.references and all(
+                    existing.get(key) == seq for key, seq in recorded.items()
+                ):
+                    logger.info("Sequence cache %s already up to date", self.cache_path)
+                    return
+
                 # Update sequences
-                existing.update(self.cache)
+                existing.update(recorded)
 
                 # Update manifest
-                manifest = existing.setdefault("_manifest", {})
-                fname = os.path.basename(self.fasta_path)
                 manifest[fname] = self.references
 
-                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
-                with open(self.cache_path, "w") as f:
+                os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+                # Write beside the cache and rename over it, so an interrupted save never truncates it.
+                tmp_path = self.cache_path + ".tmp"
+                with open(tmp_path, "w") as f:
                     json.dump(existing, f, indent=2)
+                os.replace(tmp_path, self.cache_path)
                 logger.info("Saved cache with %d sequences and manifest for %s", len(existing) - 1, fname)
             except Exception as e:
                 logger.error("Failed to save sequence cache to %s: %s", self.cache_path, e)
@@ -147,16 +323,29 @@ class RefSeqDataProvider:
         self.fasta_path = fasta_path
         # (tx_ac, chrom) -> TranscriptData
         self.transcripts: dict[tuple[str, str], typing.Any] = {}
-        # tx_ac -> list of ref_ac
-        self.tx_to_refs: dict[str, list[str]] = collections.defaultdict(list)
-        self.gene_to_transcripts: dict[str, list[str]] = collections.defaultdict(list)
+        # tx_ac -> ref_acs, gene -> tx_acs; both deduplicated, in GFF order
+        self.tx_to_refs: dict[str, tuple[str, ...]] = {}
+        self.gene_to_transcripts: dict[str, tuple[str, ...]] = {}
         self.chrom_to_transcripts: dict[str, list[typing.Any]] = collections.defaultdict(list)
         self.accession_map: dict[str, tuple[str, str]] = {}  # protein_id -> tx_id
+        # chrom -> (starts ascending, ends, running max of ends, accessions), see _build_region_index
+        self._region_index: dict[str, tuple[list[int], list[int], list[int], list[str]]] = {}
 
         self._load_gff()
         self.fasta = SequenceProxy(fasta_path)
+        # Membership sets over the FASTA's reference list, used to choose among a transcript's references.
+        self._references = frozenset(self.fasta.references)
+        self._primary_references = frozenset(r for r in self._references if r.startswith("NC_0000"))
 
         self._transcript_cache: dict[tuple[str, str], str] = {}
+        # Transcripts already served one narrow window without being materialized (see _get_tx_seq)
+        self._narrow_fetched: set[tuple[str, str]] = set()
+        # (tx_ac, ref_ac) -> translated CDS, so repeated protein queries are not retranslated
+        self._protein_cache: dict[tuple[str, str], str] = {}
+        # (tx_ac, requested ref_ac) -> resolved transcript model
+        self._transcript_model_cache: dict[tuple[str, str | None], typing.Any] = {}
+        # identifier -> IdentifierType; the same accessions are classified many times per variant
+        self._identifier_type_cache: dict[str, weaver.IdentifierType] = {}
 
     def _load_gff(self) -> None:
         """Parses the GFF file into internal transcript models."""
@@ -168,27 +357,35 @@ class RefSeqDataProvider:
         )
         genes: dict[str, str] = {}
         id_to_tx_ac: dict[str, str] = {}
+        # Insertion-ordered sets (dict keys): a transcript placed on several chromosomes is listed once per gene.
+        tx_to_refs: dict[str, dict[str, None]] = collections.defaultdict(dict)
+        gene_to_transcripts: dict[str, dict[str, None]] = collections.defaultdict(dict)
 
-        opener = gzip.open if self.gff_path.endswith(".gz") else open
+        opener = _gzip_open if self.gff_path.endswith(".gz") else open
 
         with opener(self.gff_path, "rt") as f:
             for line in f:
                 if line.startswith("#"):
                     continue
-                parts = line.strip().split("\t")
+                parts = line.rstrip("\r\n").split("\t", 8)
                 if len(parts) < 9:
                     continue
 
                 chrom, source, feature_type, start, end, _score, strand, _frame, attr_str = parts
-                attrs: dict[str, str] = {}
-                for item in attr_str.split(";"):
-                    if "=" in item:
-                        k, v = item.split("=", 1)
-                        attrs[k] = v
+                # Most lines (cDNA_match, region, ...) are of no interest; skip them before touching attributes.
+                if feature_type not in _GFF_FEATURE_TYPES:
+                    continue
 
-                feat_id = attrs.get("ID")
-                parent = attrs.get("Parent")
-                tx_ac = attrs.get("transcript_id")
+                feat_id = _gff_attribute(attr_str, "ID")
+
+                if feature_type == "gene":
+                    if feat_id:
+                        gene = _gff_attribute(attr_str, "gene")
+                        genes[feat_id] = gene if gene is not None else _gff_attribute(attr_str, "Name") or ""
+                    continue
+
+                parent = _gff_attribute(attr_str, "Parent")
+                tx_ac = _gff_attribute(attr_str, "transcript_id")
 
                 if not tx_ac:
                     if feat_id and (feat_id.startswith(("rna-NM_", "rna-NR_"))):
@@ -198,42 +395,29 @@ class RefSeqDataProvider:
                     elif parent in id_to_tx_ac:
                         tx_ac = id_to_tx_ac[parent]
 
-                if feature_type == "gene":
-                    if feat_id:
-                        genes[feat_id] = attrs.get("gene", attrs.get("Name", ""))
-
-                elif feature_type in [
-                    "mRNA",
-                    "transcript",
-                    "tRNA",
-                    "ncRNA",
-                    "lnc_RNA",
-                    "rRNA",
-                    "scRNA",
-                    "snRNA",
-                    "snoRNA",
-                ]:
-                    if tx_ac:
-                        if feat_id:
-                            id_to_tx_ac[feat_id] = tx_ac
-                        key = (tx_ac, chrom)
-                        if not tx_data[key]["info"] or source in ["RefSeq", "BestRefSeq"]:
-                            tx_data[key]["info"] = {
-                                "strand": strand,
-                                "parent": parent,
-                                "gene_name": attrs.get("gene", ""),
-                            }
-
-                elif feature_type == "exon":
-                    if tx_ac:
-                        tx_data[(tx_ac, chrom)]["exons"].add((int(start), int(end)))
-
-                elif feature_type == "CDS" and tx_ac:
+                if not tx_ac:
+                    continue
+
+                if feature_type == "exon":
+                    tx_data[(tx_ac, chrom)]["exons"].add((int(start), int(end)))
+
+                elif feature_type == "CDS":
                     tx_data[(tx_ac, chrom)]["cds"].add((int(start), int(end)))
-                    prot_id = attrs.get("protein_id")
+                    prot_id = _gff_attribute(attr_str, "protein_id")
                     if prot_id:
                         tx_data[(tx_ac, chrom)]["info"]["protein_id"] = prot_id
 
+                else:
+                    if feat_id:
+                        id_to_tx_ac[feat_id] = tx_ac
+                    key = (tx_ac, chrom)
+                    if not tx_data[key]["info"] or source in ["RefSeq", "BestRefSeq"]:
+                        tx_data[key]["info"] = {
+                            "strand": strand,
+                            "parent": parent,
+                            "gene_name": _gff_attribute(attr_str, "gene") or "",
+                        }
+
         logger.info("Finalizing %d transcript-reference pairs...", len(tx_data))
         for (tx_id, chrom), data in tx_data.items():
             info = data["info"]
@@ -298,16 +482,32 @@ class RefSeqDataProvider:
                 "end": g_max,
             }
             self.transcripts[(tx_id, chrom)] = record
-            self.tx_to_refs[tx_id].append(chrom)
+            tx_to_refs[tx_id][chrom] = None
             self.chrom_to_transcripts[chrom].append(record)
 
             if protein_id:
                 self.accession_map[protein_id] = (tx_id, chrom)
             if gene_name:
-                self.gene_to_transcripts[gene_name].append(tx_id)
+                gene_to_transcripts[gene_name][tx_id] = None
 
+        self.tx_to_refs = {tx_id: tuple(refs) for tx_id, refs in tx_to_refs.items()}
+        self.gene_to_transcripts = {gene: tuple(tx_ids) for gene, tx_ids in gene_to_transcripts.items()}
+        self._build_region_index()
         logger.info("GFF loading complete.")
 
+    def _build_region_index(self) -> None:
+        """Sorts each chromosome's transcripts by start for binary-searched region queries."""
+        for chrom, records in self.chrom_to_transcripts.items():
+            by_start = sorted(records, key=lambda tx: tx["start"])
+            ends = [tx["end"] for tx in by_start]
+            self._region_index[chrom] = (
+                [tx["start"] for tx in by_start],
+                ends,
+                # Non-decreasing, so a query can stop scanning leftwards once it drops below the query start.
+                list(itertools.accumulate(ends, max)),
+                [tx["ac"] for tx in by_start],
+            )
+
     def _genomic_to_tx(self, g_pos: int, exons: list[dict[str, typing.Any]], strand: str) -> int | None:
         """Maps genomic position to transcript index.
 
@@ -320,7 +520,13 @@ class RefSeqDataProvider:
           0-based transcript index or None if not in exons.
         """
         g_0 = g_pos - 1
-        for exon in exons:
+        # Exons are ordered 5' -> 3', so reference starts ascend on "+" and descend on "-".
+        if strand == "+":
+            i = bisect.bisect_right(exons, g_0, key=_reference_start) - 1
+        else:
+            i = bisect.bisect_left(exons, -g_0, key=_negated_reference_start)
+        if 0 <= i < len(exons):
+            exon = exons[i]
             if exon["reference_start"] <= g_0 <= exon["reference_end"]:
                 if strand == "+":
                     return exon["transcript_start"] + (g_0 - exon["reference_start"])
@@ -336,61 +542,98 @@ class RefSeqDataProvider:
             res = self.accession_map.get(ac)
             if not res:
                 return ""
-            tx_ac, chrom = res
-            tx_seq = self._get_tx_seq(tx_ac, chrom, 0, -1, force_plus=force_plus).upper()
-
-            tx_info = self.transcripts.get((tx_ac, chrom))
-            if not tx_info or tx_info.get("cds_start_index") is None:
-                return ""
-
-            cds_start = tx_info["cds_start_index"]
-            cds_end = tx_info["cds_end_index"]
-
-            if cds_start is not None and cds_end is not None:
-                cds_seq = tx_seq[cds_start : cds_end + 1]
-                translated = self._translate_cds(cds_seq)
-                if end == -1 or end is None:
-                    return translated[start:]
-                return translated[start:end]
-            return ""
+            if force_plus:
+                translated = self._get_protein_seq(*res, force_plus=True)
+            else:
+                try:
+                    translated = self._protein_cache[res]
+                except KeyError:
+                    if end is not None and 0 <= start <= end:
+                        # Translate just the requested residues; only whole-protein requests fill the cache.
+                        return self._get_protein_seq(*res, start, end)
+                    translated = self._protein_cache[res] = self._get_protein_seq(*res)
+            if end == -1 or end is None:
+                return translated[start:]
+            return translated[start:end]
 
         if "transcript" in kind.lower() or kind.lower() == "c":
             # Need to decide which reference to use if multiple exist
             refs = self.tx_to_refs.get(ac)
             if not refs:
                 return ""
-            # Prioritize standard NC chromosomes that exist in the current FASTA
-            ref_ac = next((r for r in refs if r.startswith("NC_0000") and r in self.fasta.references), None)
-            if not ref_ac:
-                ref_ac = next((r for r in refs if r in self.fasta.references), refs[0])
-
-            return self._get_tx_seq(ac, ref_ac, start, end, force_plus=force_plus).upper()
+            return self._get_tx_seq(ac, self._preferred_reference(refs), start, end, force_plus=force_plus)
 
         if "genomic" in kind.lower() or kind == "g":
             pass  # Fall through to fasta.fetch
 
         try:
+            # SequenceProxy.fetch already returns only the requested window, uppercased.
             if end == -1 or end is None:
-                return str(self.fasta.fetch(ac, start).upper())
-            return str(self.fasta.fetch(ac, start, end).upper())
+                return self.fasta.fetch(ac, start)
+            return self.fasta.fetch(ac, start, end)
         except Exception as e:
             # Try fuzzy lookup for genomic fetch too?
             # pysam.fetch usually needs exact match.
             logger.error("Error fetching genomic seq for %s: %s", ac, e)
             return ""
 
+    def _get_protein_seq(
+        self,
+        tx_ac: str,
+        ref_ac: str,
+        start: int = 0,
+        end: int | None = None,
+        force_plus: bool = False,
+    ) -> str:
+        """Translates residues [start, end) of a transcript's CDS (through the stop codon when end is None).
+
+        Only the nucleotides of the requested codons are fetched. Returns an empty string for
+        non-coding transcripts.
+        """
+        tx_info = self.transcripts.get((tx_ac, ref_ac))
+        if not tx_info or tx_info.get("cds_start_index") is None or tx_info.get("cds_end_index") is None:
+            return ""
+        cds_start = tx_info["cds_start_index"]
+        cds_stop = tx_info["cds_end_index"] + 1
+        nt_start = cds_start + start * 3
+        nt_end = cds_stop if end is None else min(cds_start + end * 3, cds_stop)
+        if nt_start >= nt_end:
+            return ""
+        return self._translate_cds(self._get_tx_seq(tx_ac, ref_ac, nt_start, nt_end, force_plus=force_plus))
+
     def _get_full_tx_seq(self, tx_ac: str, ref_ac: str) -> str:
         """Builds and caches the full transcript sequence (respecting strand)."""
         tx = self.transcripts.get((tx_ac, ref_ac))
         if not tx:
             return ""
-        seq_parts = []
         # Exons are already ordered 5' -> 3' in tx["exons"]
-        for exon in tx["exons"]:
-            s = self.fasta.fetch(tx["reference_accession"], exon["reference_start"], exon["reference_end"] + 1)
+        seq_parts = self.fasta.fetch_many(
+            tx["reference_accession"],
+            [(exon["reference_start"], exon["reference_end"] + 1) for exon in tx["exons"]],
+        )
+        if tx["strand"] == -1:
+            seq_parts = [self.reverse_complement(s) for s in seq_parts]
+        return "".join(seq_parts)
+
+    def _get_tx_window(self, tx: dict[str, typing.Any], start: int, end: int) -> str:
+        """Builds transcript bases [start, end) from just the exon segments that cover them."""
+        exons = tx["exons"]
+        ref_ac = tx["reference_accession"]
+        seq_parts = []
+        first = max(bisect.bisect_right(exons, start, key=_transcript_start) - 1, 0)
+        for exon in itertools.islice(exons, first, None):
+            tx_start = exon["transcript_start"]
+            if tx_start >= end:
+                break
+            lo = max(start, tx_start) - tx_start
+            hi = min(end, exon["transcript_end"]) - tx_start
+            if lo >= hi:
+                continue
             if tx["strand"] == -1:
-                s = self.reverse_complement(s)
-            seq_parts.append(s)
+                s = self.fasta.fetch(ref_ac, exon["reference_end"] - hi + 1, exon["reference_end"] - lo + 1)
+                seq_parts.append(self.reverse_complement(s))
+            else:
+                seq_parts.append(self.fasta.fetch(ref_ac, exon["reference_start"] + lo, exon["reference_start"] + hi))
         return "".join(seq_parts)
 
     def _get_full_tx_seq_cached(self, tx_ac: str, ref_ac: str) -> str:
@@ -406,6 +649,21 @@ class RefSeqDataProvider:
         if not tx:
             return ""
 
+        key = (tx_ac, ref_ac)
+        if (
+            end is not None
+            and 0 <= start <= end <= start + _NARROW_TX_WINDOW
+            and not (force_plus and tx["strand"] == -1)
+            and key not in self._transcript_cache
+            and key not in self._narrow_fetched
+            # Record/replay caches hold whole-exon windows; keep requesting exactly those.
+            and self.fasta.mode == "live"
+        ):
+            # A one-off narrow query only needs the exon pieces it covers; a second query on the
+            # same transcript suggests more will follow, so that one materializes the whole sequence.
+            self._narrow_fetched.add(key)
+            return self._get_tx_window(tx, start, end)
+
         full_seq = self._get_full_tx_seq_cached(tx_ac, ref_ac)
 
         if force_plus and tx["strand"] == -1:
@@ -418,6 +676,15 @@ class RefSeqDataProvider:
 
     def get_transcript(self, transcript_ac: str, reference_ac: str | None) -> typing.Any:
         """Returns the transcript model for the given accession."""
+        key = (transcript_ac, reference_ac)
+        try:
+            return self._transcript_model_cache[key]
+        except KeyError:
+            tx = self._transcript_model_cache[key] = self._resolve_transcript(transcript_ac, reference_ac)
+            return tx
+
+    def _resolve_transcript(self, transcript_ac: str, reference_ac: str | None) -> typing.Any:
+        """Picks the transcript model, preferring the requested reference, then primary chromosomes."""
         if reference_ac:
             tx = self.transcripts.get((transcript_ac, reference_ac))
             if tx:
@@ -428,22 +695,31 @@ class RefSeqDataProvider:
         if not refs:
             raise ValueError(f"Transcript {transcript_ac} not found")
 
-        # Prioritize standard NC chromosomes that exist in the current FASTA
-        ref_ac = next((r for r in refs if r.startswith("NC_0000") and r in self.fasta.references), None)
-        if not ref_ac:
-            ref_ac = next((r for r in refs if r in self.fasta.references), refs[0])
+        return self.transcripts[(transcript_ac, self._preferred_reference(refs))]
 
-        return self.transcripts[(transcript_ac, ref_ac)]
+    def _preferred_reference(self, refs: tuple[str, ...]) -> str:
+        """Picks a reference from `refs`, preferring primary NC chromosomes present in the current FASTA."""
+        ref_ac = next((r for r in refs if r in self._primary_references), None)
+        if not ref_ac:
+            ref_ac = next((r for r in refs if r in self._references), refs[0])
+        return ref_ac
 
     def get_transcripts_for_region(self, chrom: str, start: int, end: int) -> list[str]:
         """Finds transcripts overlapping a genomic region."""
-        transcripts = self.chrom_to_transcripts.get(chrom, [])
+        index = self._region_index.get(chrom)
+        if not index:
+            return []
+        starts, ends, max_ends, acs = index
+        # Each transcript appears at most once per chromosome, so no deduplication is needed.
         results = []
-        for tx in transcripts:
-            # Check overlap: (start1 <= end2) and (end1 >= start2)
-            if start <= tx["end"] and end >= tx["start"]:
-                results.append(tx["ac"])
-        return list(set(results))
+        # Only transcripts starting at or before `end` can overlap; walk them right to left
+        # until no earlier transcript can still reach `start`.
+        for i in range(bisect.bisect_right(starts, end) - 1, -1, -1):
+            if max_ends[i] < start:
+                break
+            if ends[i] >= start:
+                results.append(acs[i])
+        return results
 
     def get_symbol_accessions(self, symbol: str, source_kind: str, target_kind: str) -> list[tuple[str, str]]:
         """Maps gene symbols to transcript accessions."""
@@ -458,102 +734,39 @@ class RefSeqDataProvider:
             return [("transcript_accession", tx_ac) for tx_ac in self.gene_to_transcripts[symbol]]
         return [("gene_symbol", symbol)]
 
-    def get_identifier_type(self, identifier: str) -> str:
+    def get_identifier_type(self, identifier: str) -> weaver.IdentifierType:
         """Determines the type of the identifier."""
-        if identifier.startswith(("NC_", "NW_", "NT_")):
-            return "genomic_accession"
-        if identifier.startswith(("NM_", "NR_", "XM_", "XR_")):
-            return "transcript_accession"
-        if identifier.startswith(("NP_", "XP_")):
-            return "protein_accession"
+        try:
+            return self._identifier_type_cache[identifier]
+        except KeyError:
+            it = self._identifier_type_cache[identifier] = self._classify_identifier(identifier)
+            return it
+
+    def _classify_identifier(self, identifier: str) -> weaver.IdentifierType:
+        """Classifies by accession prefix, then falls back to gene-symbol heuristics."""
+        it = weaver.classify(identifier)
+        if it != weaver.IdentifierType.Unknown:
+            return it
         # If it's a known gene symbol
         if identifier in self.gene_to_transcripts:
-            return "gene_symbol"
+            return weaver.IdentifierType.GeneSymbol
         # Fallback heuristic: simplistic assumption that anything else might be a gene symbol
         # if it doesn't contain a colon (which would imply pre-parsed variant)
         if ":" not in identifier:
-            return "gene_symbol"
-        return "unknown"
+            return weaver.IdentifierType.GeneSymbol
+        return weaver.IdentifierType.Unknown
 
     def reverse_complement(self, seq: str) -> str:
         """Returns the reverse complement of a sequence."""
-        complement = str.maketrans("ATCGNautcgn", "TAGCNtagcgn")
-        return seq.translate(complement)[::-1]
+        return seq.translate(_COMPLEMENT_TABLE)[::-1]
 
     def _translate_cds(self, seq: str) -> str:
         """Translates a CDS nucleotide sequence into an amino acid sequence (1-letter codes)."""
-        codon_table = {
-            "ATA": "I",
-            "ATC": "I",
-            "ATT": "I",
-            "ATG": "M",
-            "ACA": "T",
-            "ACC": "T",
-            "ACG": "T",
-            "ACT": "T",
-            "AAC": "N",
-            "AAT": "N",
-            "AAA": "K",
-            "AAG": "K",
-            "AGC": "S",
-            "AGT": "S",
-            "AGA": "R",
-            "AGG": "R",
-            "CTA": "L",
-            "CTC": "L",
-            "CTG": "L",
-            "CTT": "L",
-            "CCA": "P",
-            "CCC": "P",
-            "CCG": "P",
-            "CCT": "P",
-            "CAC": "H",
-            "CAT": "H",
-            "CAA": "Q",
-            "CAG": "Q",
-            "CGA": "R",
-            "CGC": "R",
-            "CGG": "R",
-            "CGT": "R",
-            "GTA": "V",
-            "GTC": "V",
-            "GTG": "V",
-            "GTT": "V",
-            "GCA": "A",
-            "GCC": "A",
-            "GCG": "A",
-            "GCT": "A",
-            "GAC": "D",
-            "GAT": "D",
-            "GAA": "E",
-            "GAG": "E",
-            "GGA": "G",
-            "GGC": "G",
-            "GGG": "G",
-            "GGT": "G",
-            "TCA": "S",
-            "TCC": "S",
-            "TCG": "S",
-            "TCT": "S",
-            "TTC": "F",
-            "TTT": "F",
-            "TTA": "L",
-            "TTG": "L",
-            "TAC": "Y",
-            "TAT": "Y",
-            "TAA": "*",
-            "TAG": "*",
-            "TGC": "C",
-            "TGT": "C",
-            "TGA": "*",
-            "TGG": "W",
-        }
-        protein = []
-        seq = seq.upper()
-        for i in range(0, len(seq) - len(seq) % 3, 3):
-            codon = seq[i : i + 3]
-            protein.append(codon_table.get(codon, "X"))
-        return "".join(protein)
+        digits = seq.encode("ascii", "replace").translate(_BASE_DIGITS)
+        table = _CODON_TABLE
+        return "".join(
+            [table[digits[i] * 25 + digits[i + 1] * 5 + digits[i + 2]] for i in range(0, len(digits) - 2, 3)],
+        )
 
     def c_to_g(self, transcript_ac: str, pos: int, offset: int) -> tuple[str, int]:
         """Resolves a transcript position and offset to a genomic accession and position.
@@ -573,19 +786,19 @@ class RefSeqDataProvider:
 
         # This logic should match _genomic_to_tx but in reverse.
         # Transcript position 'pos' is relative to the start of the transcript sequence.
-        # We need to find the exon containing this position.
-        for exon in exons:
-            exon["reference_end"] - exon["reference_start"] + 1
-            if exon["transcript_start"] <= pos < exon["transcript_end"]:
-                # Found the exon
-                offset_in_exon = pos - exon["transcript_start"]
-                if strand == 1:
-                    g_base = exon["reference_start"] + offset_in_exon
-                    g_pos = g_base + offset
-                else:
-                    g_base = exon["reference_end"] - offset_in_exon
-                    g_pos = g_base - offset
-                return chrom, g_pos
+        # Exons tile the transcript in order, so binary search for the exon containing this position.
+        i = bisect.bisect_right(exons, pos, key=_transcript_start) - 1
+        if i >= 0 and pos < exons[i]["transcript_end"]:
+            # Found the exon
+            exon = exons[i]
+            offset_in_exon = pos - exon["transcript_start"]
+            if strand == 1:
+                g_base = exon["reference_start"] + offset_in_exon
+                g_pos = g_base + offset
+            else:
+                g_base = exon["reference_end"] - offset_in_exon
+                g_pos = g_base - offset
+            return chrom, g_pos
 
         # If not in exons (should not happen for valid cDNA variants without offset,
         # but for offset calculation we might be at exon boundary)
@@ -621,8 +834,20 @@ class ReferenceHgvsDataProvider(hgvs.dataproviders.interface.Interface):
         self.required_version = "1.1"
         super().__init__()
         self.rp = refseq_provider
+        # hgvs asks for the same sequences and transcript records many times per variant; memoize per
+        # instance. Sequences can be whole transcripts, so that cache is bounded. The transcript records
+        # are small and fixed once the GFF is loaded, so their responses are kept for the provider's lifetime.
+        self._get_seq_cached = functools.lru_cache(maxsize=1024)(self._get_seq)
+        self._get_tx_info_cached = functools.cache(self._get_tx_info)
+        self._get_tx_exons_cached = functools.cache(self._get_tx_exons)
+        self._get_tx_identity_info_cached = functools.cache(self._get_tx_identity_info)
+        self._get_pro_ac_for_tx_ac_cached = functools.cache(self._get_pro_ac_for_tx_ac)
+        self._get_tx_mapping_options_cached = functools.cache(self._get_tx_mapping_options)
 
     def get_seq(self, ac: str, start: int | None = None, end: int | None = None) -> str:
+        return self._get_seq_cached(ac, start, end)
+
+    def _get_seq(self, ac: str, start: int | None, end: int | None) -> str:
         kind = "g" if ac.startswith("NC_") else "c"
         if ac.startswith("NP_"):
             kind = "p"
@@ -634,6 +859,9 @@ class ReferenceHgvsDataProvider(hgvs.dataproviders.interface.Interface):
         alt_ac: str | None = None,
         _alt_aln_method: str | None = None,
     ) -> dict[str, typing.Any] | None:
+        return self._get_tx_info_cached(tx_ac, alt_ac)
+
+    def _get_tx_info(self, tx_ac: str, alt_ac: str | None) -> dict[str, typing.Any] | None:
         try:
             tx = self.rp.get_transcript(tx_ac, alt_ac)
             return {
@@ -653,11 +881,14 @@ class ReferenceHgvsDataProvider(hgvs.dataproviders.interface.Interface):
         alt_ac: str | None = None,
         _alt_aln_method: str | None = None,
     ) -> list[dict[str, typing.Any]] | None:
+        return self._get_tx_exons_cached(tx_ac, alt_ac)
+
+    def _get_tx_exons(self, tx_ac: str, alt_ac: str | None) -> list[dict[str, typing.Any]] | None:
         try:
             tx = self.rp.get_transcript(tx_ac, alt_ac)
             res = []
-            exons_transcript = sorted(tx["exons"], key=lambda x: x["transcript_start"])
-            for i, e in enumerate(exons_transcript):
+            # tx["exons"] is already in transcript order (5' -> 3'), which is what "ord" numbers.
+            for i, e in enumerate(tx["exons"]):
                 res.append(
                     {
                         "tx_ac": tx_ac,
@@ -672,12 +903,17 @@ class ReferenceHgvsDataProvider(hgvs.dataproviders.interface.Interface):
                         "cigar": e["cigar"],
                     },
                 )
-            res.sort(key=lambda x: x["alt_start_i"])
+            # hgvs wants genomic order: transcript order on "+", its reverse on "-".
+            if tx["strand"] == -1:
+                res.reverse()
             return res
         except Exception:
             return None
 
     def get_tx_identity_info(self, tx_ac: str) -> dict[str, typing.Any] | None:
+        return self._get_tx_identity_info_cached(tx_ac)
+
+    def _get_tx_identity_info(self, tx_ac: str) -> dict[str, typing.Any] | None:
         try:
             tx = self.rp.get_transcript(tx_ac, None)
             total_len = tx["exons"][-1]["transcript_end"]
@@ -705,6 +941,9 @@ class ReferenceHgvsDataProvider(hgvs.dataproviders.interface.Interface):
         return {}
 
     def get_pro_ac_for_tx_ac(self, tx_ac: str) -> str | None:
+        return self._get_pro_ac_for_tx_ac_cached(tx_ac)
+
+    def _get_pro_ac_for_tx_ac(self, tx_ac: str) -> str | None:
         try:
             tx = self.rp.get_transcript(tx_ac, None)
             return str(tx.get("protein_id"))
@@ -718,6 +957,9 @@ class ReferenceHgvsDataProvider(hgvs.dataproviders.interface.Interface):
         return []
 
     def get_tx_mapping_options(self, tx_ac: str) -> list[dict[str, typing.Any]]:
+        return self._get_tx_mapping_options_cached(tx_ac)
+
+    def _get_tx_mapping_options(self, tx_ac: str) -> list[dict[str, typing.Any]]:
         try:
             refs = self.rp.tx_to_refs.get(tx_ac, [])
             return [{"tx_ac": tx_ac, "alt_ac": r, "alt_aln_method": "transcript"} for r in refs]